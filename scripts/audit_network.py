@@ -0,0 +1,354 @@
+import sys
+import time
+import asyncio
+import argparse
+from playwright.async_api import async_playwright
+
+from perf_harness import (
+    DevServer, LOADER_DONE_JS, LOADER_TRACKER_JS, READY_TIMEOUT_MS, VIEWPORT, launch_browser, load_json, write_json,
+    timestamped,
+)
+
+# Configuration
+SETTLE_S = 5  # keep observing after the loader is gone, for lazy/idle-time fetches
+# Resource types whose use we can observe from the page; scripts, styles and fonts take effect
+# on load, so they're never reported as unused. "Other" (favicon, beacons/ping) has no page-side
+# consumer to observe, so it would always show up as unused.
+USAGE_TRACKED_TYPES = {"Image", "Media", "Fetch", "XHR"}
+PRELOADABLE_TYPES = {"Script", "Stylesheet", "Font", "Fetch", "XHR", "Image", "Media"}
+# A dependency found later than this after the document request is worth a <link rel=preload>
+LATE_DISCOVERY_MS = 300
+
+# Records which asset URLs the page actually consumes: response bodies read by script
+# (fetch/XHR), images/video uploaded to WebGL, media played, and images painted by the DOM.
+USAGE_TRACKER_JS = """
+(() => {
+  if (window.__assetUsage) return;
+  const used = window.__assetUsage = new Set();
+  const mark = (url) => { if (url) used.add(new URL(url, location.href).href); };
+
+  for (const m of ['json', 'text', 'arrayBuffer', 'blob']) {
+    const orig = Response.prototype[m];
+    Response.prototype[m] = function (...args) { mark(this.url); return orig.apply(this, args); };
+  }
+  for (const prop of ['response', 'responseText']) {
+    const desc = Object.getOwnPropertyDescriptor(XMLHttpRequest.prototype, prop);
+    Object.defineProperty(XMLHttpRequest.prototype, prop, {
+      ...desc, get() { mark(this.responseURL); return desc.get.call(this); }
+    });
+  }
+  const playOrig = HTMLMediaElement.prototype.play;
+  HTMLMediaElement.prototype.play = function (...args) { mark(this.currentSrc || this.src); return playOrig.apply(this, args); };
+
+  const wrapUpload = (proto) => {
+    for (const fn of ['texImage2D', 'texSubImage2D', 'texImage3D', 'texSubImage3D']) {
+      const orig = proto[fn];
+      if (!orig) continue;
+      proto[fn] = function (...args) {
+        for (const a of args) {
+          if (a instanceof HTMLImageElement || a instanceof HTMLVideoElement) mark(a.currentSrc || a.src);
+        }
+        return orig.apply(this, args);
+      };
+    }
+  };
+  wrapUpload(WebGLRenderingContext.prototype);
+  if (window.WebGL2RenderingContext) wrapUpload(WebGL2RenderingContext.prototype);
+
+  window.__collectAssetUsage = () => {
+    for (const img of document.images) if (img.complete && img.naturalWidth) mark(img.currentSrc || img.src);
+    for (const el of document.querySelectorAll('*')) {
+      const bg = getComputedStyle(el).backgroundImage;
+      for (const m of bg.matchAll(/url\\(["']?([^"')]+)["']?\\)/g)) if (!m[1].startsWith('data:')) mark(m[1]);
+    }
+    return [...used];
+  };
+})();
+"""
+
+class RequestLog:
+    """Collects one load's requests from CDP Network events, keyed by requestId."""
+
+    def __init__(self):
+        self.requests = {}
+        self.start = None
+
+    def attach(self, cdp):
+        cdp.on("Network.requestWillBeSent", self.on_request)
+        cdp.on("Network.responseReceived", self.on_response)
+        cdp.on("Network.requestServedFromCache", self.on_cache)
+        cdp.on("Network.dataReceived", self.on_data)
+        cdp.on("Network.loadingFinished", self.on_finished)
+        cdp.on("Network.loadingFailed", self.on_failed)
+
+    def on_request(self, e):
+        if e["request"]["url"].startswith("data:"):
+            return
+        if self.start is None and e.get("type") == "Document":
+            self.start = e["timestamp"]
+        # Redirects reuse the requestId; keep the final hop
+        self.requests[e["requestId"]] = {
+            "url": e["request"]["url"],
+            "type": e.get("type", "Other"),
+            "initiator": initiator_url(e.get("initiator", {})),
+            "initiator_type": e.get("initiator", {}).get("type"),
+            "priority": e["request"].get("initialPriority"),
+            "sent": e["timestamp"],
+            "transfer_bytes": 0,
+            "resource_bytes": 0,
+            "cache": None,
+        }
+
+    def on_response(self, e):
+        r = self.requests.get(e["requestId"])
+        if not r:
+            return
+        resp = e["response"]
+        r["status"] = resp.get("status")
+        r["mime"] = resp.get("mimeType")
+        r["type"] = e.get("type", r["type"])
+        if resp.get("fromDiskCache") or resp.get("fromPrefetchCache"):
+            r["cache"] = "disk"
+        elif resp.get("fromServiceWorker"):
+            r["cache"] = "service-worker"
+        elif resp.get("status") == 304:
+            r["cache"] = "revalidated"
+
+    def on_cache(self, e):
+        r = self.requests.get(e["requestId"])
+        if r:
+            r["cache"] = "memory"
+
+    def on_data(self, e):
+        r = self.requests.get(e["requestId"])
+        if r:
+            r["resource_bytes"] += e.get("dataLength", 0)
+
+    def on_finished(self, e):
+        r = self.requests.get(e["requestId"])
+        if r:
+            r["finished"] = e["timestamp"]
+            r["transfer_bytes"] = e.get("encodedDataLength", 0)
+
+    def on_failed(self, e):
+        r = self.requests.get(e["requestId"])
+        if r:
+            r["finished"] = e["timestamp"]
+            r["failed"] = e.get("errorText", "failed")
+
+    def since_start_ms(self, timestamp):
+        return round((timestamp - self.start) * 1000, 1) if self.start else None
+
+    def entries(self):
+        out = []
+        for r in self.requests.values():
+            entry = dict(r)
+            entry["start_ms"] = self.since_start_ms(r["sent"])
+            entry["end_ms"] = self.since_start_ms(r["finished"]) if "finished" in r else None
+            del entry["sent"]
+            entry.pop("finished", None)
+            out.append(entry)
+        out.sort(key=lambda r: r["start_ms"] if r["start_ms"] is not None else 0)
+        return out
+
+def initiator_url(initiator):
+    if initiator.get("url"):
+        return initiator["url"]
+    stack = initiator.get("stack")
+    # Async stacks (fetch inside a promise chain) keep the originating script further up
+    while stack:
+        for frame in stack.get("callFrames", []):
+            if frame.get("url"):
+                return frame["url"]
+        stack = stack.get("parent")
+    return None
+
+def assign_depths(entries):
+    """Chain depth per request: the document is 0, anything it starts is 1, and so on."""
+    first = {}
+    for r in entries:
+        first.setdefault(r["url"], r)
+    for r in entries:
+        if r["type"] == "Document" and "depth" not in r:
+            r["depth"] = 0
+    for r in entries:
+        if "depth" in r:
+            continue
+        chain, current = [], r
+        while current is not None and "depth" not in current and current not in chain:
+            chain.append(current)
+            current = first.get(current["initiator"]) if current["initiator"] else None
+        base = current["depth"] if current is not None and "depth" in current else 0
+        for i, node in enumerate(reversed(chain)):
+            node["depth"] = base + i + 1
+
+def summarize_load(entries, ready_ms):
+    by_type = {}
+    for r in entries:
+        t = by_type.setdefault(r["type"], {"requests": 0, "transfer_bytes": 0, "resource_bytes": 0})
+        t["requests"] += 1
+        t["transfer_bytes"] += r["transfer_bytes"]
+        t["resource_bytes"] += r["resource_bytes"]
+
+    hits = sum(1 for r in entries if r["cache"] in ("memory", "disk", "service-worker"))
+    revalidated = sum(1 for r in entries if r["cache"] == "revalidated")
+    critical = [r for r in entries if r["end_ms"] is not None and r["end_ms"] <= ready_ms]
+    return {
+        "ready_ms": round(ready_ms),
+        "requests": len(entries),
+        "failed": sum(1 for r in entries if r.get("failed")),
+        "transfer_bytes": sum(r["transfer_bytes"] for r in entries),
+        "resource_bytes": sum(r["resource_bytes"] for r in entries),
+        "cache_hit_ratio": round(hits / len(entries), 3) if entries else 0.0,
+        "revalidated": revalidated,
+        # Longest initiator chain that had to finish before the game was interactive
+        "critical_path_depth": max((r["depth"] for r in critical), default=0),
+        "critical_requests": len(critical),
+        "by_type": dict(sorted(by_type.items(), key=lambda t: -t[1]["transfer_bytes"])),
+    }
+
+def find_unused(entries, used):
+    used_paths = {u.split("?", 1)[0] for u in used}
+    unused = []
+    for r in entries:
+        if r["type"] not in USAGE_TRACKED_TYPES or r.get("failed") or r["url"].startswith("blob:"):
+            continue
+        if r["url"].split("?", 1)[0] not in used_paths:
+            unused.append({"url": r["url"], "type": r["type"], "transfer_bytes": r["transfer_bytes"]})
+    return sorted(unused, key=lambda r: -r["transfer_bytes"])
+
+def find_duplicates(entries):
+    # Same URL fetched twice, or the same file (name + size) served from different paths,
+    # e.g. copies of sprites.json under public/ and public/assets/atlas/
+    by_url, by_content = {}, {}
+    for r in entries:
+        if r.get("failed") or not r["resource_bytes"]:
+            continue
+        by_url.setdefault(r["url"].split("?", 1)[0], []).append(r)
+        name = r["url"].split("?", 1)[0].rsplit("/", 1)[-1]
+        by_content.setdefault((name, r["resource_bytes"]), set()).add(r["url"].split("?", 1)[0])
+    dupes = [{"url": url, "count": len(rs), "transfer_bytes": sum(x["transfer_bytes"] for x in rs)}
+             for url, rs in by_url.items() if len(rs) > 1]
+    dupes += [{"copies": sorted(urls), "bytes": size} for (name, size), urls in by_content.items() if len(urls) > 1]
+    return dupes
+
+def find_preload_candidates(entries, ready_ms):
+    # Needed before the game was ready, but only discovered after another request finished
+    out = []
+    for r in entries:
+        if r["type"] not in PRELOADABLE_TYPES or r["depth"] < 2 or r["initiator_type"] == "preload":
+            continue
+        if r["end_ms"] is None or r["end_ms"] > ready_ms or r["start_ms"] < LATE_DISCOVERY_MS:
+            continue
+        out.append({"url": r["url"], "type": r["type"], "depth": r["depth"],
+                    "discovered_ms": r["start_ms"], "finished_ms": r["end_ms"]})
+    return sorted(out, key=lambda r: -r["finished_ms"])
+
+async def load_once(page, url):
+    cdp = await page.context.new_cdp_session(page)
+    log = RequestLog()
+    log.attach(cdp)
+    await cdp.send("Network.enable")
+    await cdp.send("Performance.enable")
+
+    await page.goto(url)
+    await page.wait_for_selector("canvas", state="attached", timeout=READY_TIMEOUT_MS)
+    # Loader seen and dismissed; "no loader" alone is also true before the scene chunk suspends
+    await page.wait_for_function(LOADER_DONE_JS, arg=0, timeout=READY_TIMEOUT_MS)
+    # Measured on the CDP clock, like the waterfall: the "Timestamp" metric and Network event
+    # timestamps share one monotonic clock, so ready_ms and each request's end_ms are both
+    # relative to the Document's requestWillBeSent (performance.now() starts earlier, at
+    # navigation start, and would make ready look later than requests that finished before it)
+    metrics = await cdp.send("Performance.getMetrics")
+    ready_ms = log.since_start_ms(next(m["value"] for m in metrics["metrics"] if m["name"] == "Timestamp"))
+    await asyncio.sleep(SETTLE_S)
+    used = await page.evaluate("() => window.__collectAssetUsage()")
+    await cdp.detach()
+
+    entries = log.entries()
+    assign_depths(entries)
+    return entries, ready_ms, used
+
+async def audit(url):
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            # A fresh context starts with an empty HTTP cache; reloading in it gives the warm load
+            context = await browser.new_context(viewport=VIEWPORT)
+            await context.add_init_script(USAGE_TRACKER_JS)
+            await context.add_init_script(LOADER_TRACKER_JS)
+            page = await context.new_page()
+
+            print("Cold load...")
+            cold, cold_ready, used = await load_once(page, url)
+            print("Warm load...")
+            warm, warm_ready, _ = await load_once(page, url)
+            await context.close()
+        finally:
+            await browser.close()
+
+    return {
+        "url": url,
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cold": summarize_load(cold, cold_ready),
+        "warm": summarize_load(warm, warm_ready),
+        "unused": find_unused(cold, used),
+        "duplicates": find_duplicates(cold),
+        "preload_candidates": find_preload_candidates(cold, cold_ready),
+        "waterfall": {"cold": cold, "warm": warm},
+    }
+
+def print_report(report):
+    for load in ("cold", "warm"):
+        s = report[load]
+        print(f"\n{load.upper()}: ready in {s['ready_ms']} ms, {s['requests']} requests, "
+              f"{s['transfer_bytes'] / 1024:.1f} KiB transferred, cache hits {s['cache_hit_ratio']:.0%} "
+              f"(+{s['revalidated']} revalidated), critical path depth {s['critical_path_depth']}")
+        for kind, t in s["by_type"].items():
+            print(f"  {kind:12} {t['requests']:4d} req  {t['transfer_bytes'] / 1024:9.1f} KiB")
+
+    if report["unused"]:
+        print(f"\nDownloaded but never used ({len(report['unused'])}):")
+        for r in report["unused"]:
+            print(f"  {r['transfer_bytes'] / 1024:8.1f} KiB  {r['url']}")
+    if report["duplicates"]:
+        print("\nDuplicates:")
+        for d in report["duplicates"]:
+            print(f"  {d['url']} x{d['count']}" if "url" in d else f"  {d['bytes']} bytes at {', '.join(d['copies'])}")
+    if report["preload_candidates"]:
+        print("\nPreload candidates (late-discovered, on the critical path):")
+        for r in report["preload_candidates"]:
+            print(f"  depth {r['depth']}  found at {r['discovered_ms']:.0f} ms  {r['url']}")
+
+def compare(old, new):
+    print(f"\n{'metric':28} {'old':>12} {'new':>12}")
+    for load in ("cold", "warm"):
+        for key in ("ready_ms", "requests", "transfer_bytes", "cache_hit_ratio", "critical_path_depth"):
+            print(f"{load + '.' + key:28} {old[load][key]:>12} {new[load][key]:>12}")
+    for key in ("unused", "duplicates", "preload_candidates"):
+        print(f"{key:28} {len(old[key]):>12} {len(new[key]):>12}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record cold/warm-cache network waterfalls and flag unused, duplicate and preloadable assets.")
+    parser.add_argument("--mode", choices=["dev", "preview"], default="preview",
+                        help="preview audits the production build (run `npm run build` first); dev serves unbundled modules")
+    parser.add_argument("--url", help="Audit this URL instead of starting a local server (e.g. the deployed site)")
+    parser.add_argument("--out", help="Results JSON (default: perf_results/network-<timestamp>.json)")
+    parser.add_argument("--compare", metavar="OLD", help="Print key metrics next to an earlier audit")
+    args = parser.parse_args()
+
+    if args.url:
+        report = asyncio.run(audit(args.url))
+    else:
+        with DevServer(args.mode) as server:
+            report = asyncio.run(audit(server.url))
+
+    print_report(report)
+    write_json(args.out or timestamped("network"), report)
+
+    if args.compare:
+        old = load_json(args.compare)
+        if old is None:
+            print(f"{args.compare} not found")
+            sys.exit(1)
+        compare(old, report)
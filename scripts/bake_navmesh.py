@@ -0,0 +1,210 @@
+import os
+import json
+import math
+import argparse
+
+# Configuration
+OUTPUT_DIR = "public/assets/nav"
+ZONE = "level1"  # NavigationSystem.ZONE
+MERGE_TOLERANCE = 1e-4  # Same default as Pathfinding.createZone
+
+# Matches the hidden floor in NavigationManager.tsx: 40x40 plane, 10x10 segments, at y=0.
+DEFAULT_LAYOUT = {
+    "bounds": [-20, -20, 20, 20],  # minX, minZ, maxX, maxZ
+    "cellSize": 4,
+    "y": 0,
+    "obstacles": [],  # [minX, minZ, maxX, maxZ] rects; cells whose centre falls inside are cut out
+}
+
+def round2(v):
+    # three-pathfinding's Utils.roundNumber(value, 2)
+    return round(v * 100) / 100
+
+def triangulate_layout(layout):
+    """Grid-triangulate the walkable floor, skipping cells covered by obstacles."""
+    min_x, min_z, max_x, max_z = layout["bounds"]
+    cell = layout["cellSize"]
+    y = layout.get("y", 0)
+    obstacles = layout.get("obstacles", [])
+    cols = int(round((max_x - min_x) / cell))
+    rows = int(round((max_z - min_z) / cell))
+
+    vertices = []
+    for iz in range(rows + 1):
+        for ix in range(cols + 1):
+            vertices.append((min_x + ix * cell, y, min_z + iz * cell))
+
+    def blocked(ix, iz):
+        cx = min_x + (ix + 0.5) * cell
+        cz = min_z + (iz + 0.5) * cell
+        return any(o[0] <= cx <= o[2] and o[1] <= cz <= o[3] for o in obstacles)
+
+    triangles = []
+    for iz in range(rows):
+        for ix in range(cols):
+            if blocked(ix, iz):
+                continue
+            # Same split as THREE.PlaneGeometry: (a, b, d), (b, c, d)
+            a = iz * (cols + 1) + ix
+            b = (iz + 1) * (cols + 1) + ix
+            c = (iz + 1) * (cols + 1) + ix + 1
+            d = iz * (cols + 1) + ix + 1
+            triangles.append((a, b, d))
+            triangles.append((b, c, d))
+    return vertices, triangles
+
+def read_obj(path):
+    """Minimal Wavefront OBJ reader: positions + faces (fan-triangulated). World space, Y up."""
+    vertices, triangles = [], []
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == "v":
+                vertices.append(tuple(float(p) for p in parts[1:4]))
+            elif parts[0] == "f":
+                # "f 1/2/3 4/5/6 ..." -> 1-based (or negative, relative) position indices
+                idx = []
+                for p in parts[1:]:
+                    i = int(p.split("/")[0])
+                    idx.append(i - 1 if i > 0 else len(vertices) + i)
+                for k in range(1, len(idx) - 1):
+                    triangles.append((idx[0], idx[k], idx[k + 1]))
+    return vertices, triangles
+
+def merge_vertices(vertices, triangles, tolerance):
+    # Same job as BufferGeometryUtils.mergeVertices: weld coincident positions so neighbouring
+    # triangles share vertex ids (which is how adjacency is found). Not the same numbering:
+    # mergeVertices walks the index buffer, ids follow first use by a triangle, and it truncates
+    # positions (~~) where this rounds. Ids here follow the vertex list instead.
+    decimals = max(0, round(-math.log10(tolerance)))
+    remap, merged, lookup = [], [], {}
+    for v in vertices:
+        key = tuple(round(c, decimals) for c in v)
+        if key not in lookup:
+            lookup[key] = len(merged)
+            merged.append(v)
+        remap.append(lookup[key])
+
+    welded = []
+    for a, b, c in triangles:
+        a, b, c = remap[a], remap[b], remap[c]
+        if a != b and b != c and a != c:  # drop triangles collapsed by the weld
+            welded.append((a, b, c))
+    return merged, welded
+
+def build_neighbours(polygons, vertex_polygons):
+    # Port of Builder._buildPolygonNeighbours: two polygons are neighbours when they share
+    # an edge (two vertices). Vertex ids differ from a runtime bake (see merge_vertices), so
+    # the zone is not identical to one built by createZone, only the same graph: neighbours,
+    # portals and groups describe the same polygons. Nothing compares ids across the two.
+    for pi, (a, b, c) in enumerate(polygons):
+        group_a, group_b, group_c = vertex_polygons[a], vertex_polygons[b], vertex_polygons[c]
+        neighbours = []
+        for cand in group_a:
+            if cand != pi and (cand in group_b or cand in group_c) and cand not in neighbours:
+                neighbours.append(cand)
+        for cand in group_b:
+            if cand != pi and cand in group_c and cand not in neighbours:
+                neighbours.append(cand)
+        yield neighbours
+
+def shared_vertices_in_order(a, b):
+    # Port of Builder._getSharedVerticesInOrder; the order feeds the funnel (string pull).
+    a0, a1, a2 = a
+    s0, s1, s2 = a0 in b, a1 in b, a2 in b
+    if s0 and s1 and s2:
+        return list(a)
+    if s0 and s1:
+        return [a0, a1]
+    if s1 and s2:
+        return [a1, a2]
+    if s0 and s2:
+        return [a2, a0]
+    return []
+
+def build_groups(neighbours):
+    # Port of Builder._buildPolygonGroups: connected components, flood-filled in batches
+    group_of = [None] * len(neighbours)
+    groups = []
+    for seed in range(len(neighbours)):
+        if group_of[seed] is not None:
+            groups[group_of[seed]].append(seed)
+            continue
+        gid = len(groups)
+        group_of[seed] = gid
+        batch = {seed}
+        while batch:
+            next_batch = set()
+            for p in batch:
+                group_of[p] = gid
+                next_batch.update(n for n in neighbours[p] if group_of[n] is None)
+            batch = next_batch
+        groups.append([seed])
+    return groups
+
+def bake_zone(vertices, triangles, tolerance=MERGE_TOLERANCE):
+    """Build the same zone structure as Pathfinding.createZone, offline."""
+    vertices, polygons = merge_vertices(vertices, triangles, tolerance)
+    vertices = [tuple(round2(c) for c in v) for v in vertices]
+
+    vertex_polygons = [[] for _ in vertices]
+    for pi, poly in enumerate(polygons):
+        for vid in poly:
+            vertex_polygons[vid].append(pi)
+    neighbours = list(build_neighbours(polygons, vertex_polygons))
+
+    groups = []
+    for group in build_groups(neighbours):
+        local = {poly: i for i, poly in enumerate(group)}
+        nodes = []
+        for poly in group:
+            vids = polygons[poly]
+            centroid = [round2(sum(vertices[v][axis] for v in vids) / 3) for axis in range(3)]
+            nodes.append({
+                "neighbours": [local[n] for n in neighbours[poly]],
+                "vertexIds": list(vids),
+                "centroid": centroid,
+                "portals": [shared_vertices_in_order(vids, polygons[n]) for n in neighbours[poly]],
+            })
+        groups.append(nodes)
+
+    return {
+        "format": "pfiso-navmesh",
+        "version": 1,
+        # Flat [x0, y0, z0, x1, ...]; NavigationSystem.loadBakedZone rebuilds Vector3s
+        "vertices": [c for v in vertices for c in v],
+        "groups": groups,
+    }
+
+def bake_navmesh(vertices, triangles, output_path):
+    zone = bake_zone(vertices, triangles)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(zone, f, separators=(",", ":"))
+
+    nodes = sum(len(g) for g in zone["groups"])
+    print(f"Baked {nodes} polygons in {len(zone['groups'])} group(s), "
+          f"{len(zone['vertices']) // 3} vertices -> {output_path} ({os.path.getsize(output_path)} bytes)")
+    return zone
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bake a three-pathfinding zone offline for NavigationSystem.loadBakedZone.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--layout", help="Level layout JSON (bounds, cellSize, y, obstacles)")
+    source.add_argument("--obj", help="Exported navmesh geometry (.obj, world space)")
+    parser.add_argument("--zone", default=ZONE, help="Zone name, used for the output filename")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Output directory")
+    args = parser.parse_args()
+
+    if args.obj:
+        verts, tris = read_obj(args.obj)
+    else:
+        layout = dict(DEFAULT_LAYOUT)
+        if args.layout:
+            with open(args.layout) as f:
+                layout.update(json.load(f))
+        verts, tris = triangulate_layout(layout)
+
+    bake_navmesh(verts, tris, os.path.join(args.out, f"{args.zone}.json"))
@@ -0,0 +1,155 @@
+import os
+import sys
+import asyncio
+import argparse
+import itertools
+from playwright.async_api import async_playwright
+
+from perf_harness import (
+    DevServer, LOADER_DONE_JS, READY_TIMEOUT_MS, VIEWPORT, launch_browser, new_instrumented_page, start_game,
+    record, summarize_frames, describe_error, write_json, timestamped,
+)
+from bench_frame_time import walk
+
+# Same scripted scenario across emulated devices/orientations under CDP CPU and network
+# throttling, so we can see which configurations fall below the Req/04 targets.
+
+# Configuration
+DEVICES = ["Desktop", "Pixel 5", "Galaxy S9+", "iPhone 12", "iPad Mini"]
+ORIENTATIONS = ["portrait", "landscape"]
+CPU_RATES = [1, 4, 6]
+DEFAULT_NETWORK = "4g"
+SCENARIO_S = 6  # bench_frame_time.walk holds W/D/S/A for 1.5 s each
+
+# Req/04_Technical_Specs.md: desktop 60 FPS, mobile 30+ FPS, initial TTI < 3 s
+TARGET_FPS = {"desktop": 60, "mobile": 30}
+TARGET_READY_MS = 3000
+
+# Network.emulateNetworkConditions presets (throughput in bytes/s), as DevTools defines them
+NETWORK_PROFILES = {
+    "none": None,
+    "4g": {"latency": 60, "downloadThroughput": 9 * 1024 * 1024 / 8 * 0.9, "uploadThroughput": 1.5 * 1024 * 1024 / 8 * 0.9},
+    "fast-3g": {"latency": 562.5, "downloadThroughput": 1.6 * 1024 * 1024 / 8 * 0.9, "uploadThroughput": 750 * 1024 / 8 * 0.9},
+    "slow-3g": {"latency": 2000, "downloadThroughput": 500 * 1024 / 8 * 0.8, "uploadThroughput": 500 * 1024 / 8 * 0.8},
+}
+
+def context_options(p, device, orientation):
+    if device == "Desktop":
+        return {"viewport": dict(VIEWPORT)}
+    name = f"{device} landscape" if orientation == "landscape" else device
+    options = dict(p.devices[name])
+    # Descriptors for iOS devices default to WebKit; we only launch Chromium (for CDP throttling)
+    options.pop("default_browser_type", None)
+    return options
+
+async def run_config(p, browser, url, device, orientation, cpu_rate, network):
+    context = await browser.new_context(**context_options(p, device, orientation))
+    page = await new_instrumented_page(context)
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Emulation.setCPUThrottlingRate", {"rate": cpu_rate})
+    if NETWORK_PROFILES[network]:
+        await cdp.send("Network.enable")
+        await cdp.send("Network.emulateNetworkConditions", {"offline": False, **NETWORK_PROFILES[network]})
+
+    result = {"device": device, "orientation": orientation, "cpu": cpu_rate, "network": network}
+    try:
+        # Throttled loads can take much longer than the default readiness timeout
+        timeout = READY_TIMEOUT_MS * max(cpu_rate, 2)
+        await page.goto(url, timeout=timeout)
+        await page.wait_for_selector("canvas", state="attached", timeout=timeout)
+        await page.wait_for_function(LOADER_DONE_JS, arg=0, timeout=timeout)
+        result["ready_ms"] = round(await page.evaluate("() => performance.now()"))
+        await start_game(page)
+
+        frames = summarize_frames(await record(page, SCENARIO_S, walk))
+        heap = await cdp.send("Runtime.getHeapUsage")
+        result.update({
+            "avg_fps": frames.get("avg_fps"),
+            "p50_ms": frames.get("p50_ms"),
+            "p95_ms": frames.get("p95_ms"),
+            "p99_ms": frames.get("p99_ms"),
+            "dropped_frames": frames.get("dropped_frames"),
+            "long_tasks": frames.get("long_tasks"),
+            "heap_mb": round(heap["usedSize"] / 2**20, 2),
+            "heap_peak_mb": frames.get("heap_peak_mb"),
+        })
+    except Exception as e:
+        result["error"] = describe_error(e)
+    finally:
+        await context.close()
+
+    kind = "desktop" if device == "Desktop" else "mobile"
+    result["target_fps"] = TARGET_FPS[kind]
+    result["meets_target"] = (
+        "error" not in result
+        and (result.get("avg_fps") or 0) >= TARGET_FPS[kind]
+        and result["ready_ms"] <= TARGET_READY_MS
+    )
+    return result
+
+async def run(url, configs):
+    results = []
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            # Sequential on purpose: concurrent contexts would share the host CPU and skew throttled numbers
+            for i, config in enumerate(configs, 1):
+                print(f"[{i}/{len(configs)}] {config[0]} {config[1]} cpu x{config[2]} net {config[3]}")
+                results.append(await run_config(p, browser, url, *config))
+        finally:
+            await browser.close()
+    return results
+
+def build_configs(devices, orientations, cpu_rates, networks):
+    configs = []
+    for device, orientation, cpu, network in itertools.product(devices, orientations, cpu_rates, networks):
+        # Desktop has no orientation; run it once
+        if device == "Desktop" and orientation != orientations[0]:
+            continue
+        configs.append((device, "landscape" if device == "Desktop" else orientation, cpu, network))
+    return configs
+
+def format_table(results):
+    cols = [
+        ("device", "Device"), ("orientation", "Orient."), ("cpu", "CPU"), ("network", "Network"),
+        ("ready_ms", "Ready ms"), ("avg_fps", "Avg FPS"), ("p95_ms", "p95 ms"), ("p99_ms", "p99 ms"),
+        ("dropped_frames", "Dropped"), ("heap_mb", "Heap MiB"), ("meets_target", "Target"),
+    ]
+    def cell(r, key):
+        if key == "cpu":
+            return f"{r['cpu']}x"
+        if key == "meets_target":
+            return "ok" if r["meets_target"] else ("error" if "error" in r else f"below {r['target_fps']} fps/3 s")
+        value = r.get(key)
+        return "-" if value is None else str(value)
+
+    lines = ["| " + " | ".join(title for _, title in cols) + " |", "|" + "---|" * len(cols)]
+    for r in results:
+        lines.append("| " + " | ".join(cell(r, key) for key, _ in cols) + " |")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one scenario across emulated devices, orientations, CPU and network throttling.")
+    parser.add_argument("--mode", choices=["dev", "preview"], default="preview", help="Serve with `npm run dev` or `npm run preview`")
+    parser.add_argument("--device", action="append", choices=DEVICES, help="Only these devices (repeatable)")
+    parser.add_argument("--orientation", action="append", choices=ORIENTATIONS, help="Only these orientations (repeatable)")
+    parser.add_argument("--cpu", action="append", type=int, help=f"CPU slowdown factors (default: {CPU_RATES})")
+    parser.add_argument("--network", action="append", choices=list(NETWORK_PROFILES), help=f"Network profiles (default: {DEFAULT_NETWORK})")
+    parser.add_argument("--out", help="Results JSON (default: perf_results/device_matrix-<timestamp>.json); table is written alongside as .md")
+    args = parser.parse_args()
+
+    configs = build_configs(args.device or DEVICES, args.orientation or ORIENTATIONS,
+                            args.cpu or CPU_RATES, args.network or [DEFAULT_NETWORK])
+    with DevServer(args.mode) as server:
+        results = asyncio.run(run(server.url, configs))
+
+    table = format_table(results)
+    print("\n" + table)
+    out = args.out or timestamped("device_matrix")
+    write_json(out, results)
+    with open(os.path.splitext(out)[0] + ".md", "w") as f:
+        f.write(table + "\n")
+
+    below = [r for r in results if not r["meets_target"]]
+    print(f"\n{len(results) - len(below)}/{len(results)} configurations meet target")
+    sys.exit(1 if any("error" in r for r in results) else 0)
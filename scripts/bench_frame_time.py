@@ -0,0 +1,114 @@
+import os
+import sys
+import asyncio
+import argparse
+from playwright.async_api import async_playwright
+
+from perf_harness import (
+    DevServer, RESULTS_DIR, VIEWPORT, launch_browser, new_instrumented_page, wait_for_game_ready, start_game, record,
+    summarize_frames, compare_to_baseline, load_json, write_json, timestamped,
+)
+
+# Configuration
+# Lives in the git-ignored perf_results/: SwiftShader numbers depend on the host, so create it with
+# --update-baseline on the machine (or CI runner) that runs the comparison.
+BASELINE_PATH = os.path.join(RESULTS_DIR, "perf_baseline.json")
+TOLERANCE = 0.10  # 10% worse than baseline counts as a regression
+
+async def walk(page):
+    # PERF_002: hold each direction in turn, like a player exploring the room
+    for key in ("w", "d", "s", "a"):
+        await page.keyboard.down(key)
+        await asyncio.sleep(1.5)
+        await page.keyboard.up(key)
+
+async def look(page):
+    # PERF_002 also saw spikes on mouse movement (CameraController lerp)
+    cx, cy = VIEWPORT["width"] // 2, VIEWPORT["height"] // 2
+    for i in range(60):
+        await page.mouse.move(cx + (i % 20 - 10) * 20, cy + (i % 10 - 5) * 10)
+        await asyncio.sleep(0.1)
+
+async def dash_jump(page):
+    for _ in range(6):
+        await page.keyboard.down("w")
+        await page.keyboard.press("Shift")
+        await page.keyboard.press("Space")
+        await asyncio.sleep(0.5)
+        await page.keyboard.up("w")
+        await asyncio.sleep(0.3)
+
+# Scenario -> (seconds, input coroutine). "idle" reproduces PERF_001 (5 s, no input).
+SCENARIOS = {
+    "idle": (5, None),
+    "walk": (6, walk),
+    "look": (6, look),
+    "dash_jump": (5, dash_jump),
+}
+
+async def run(url, scenarios, runs):
+    results = {}
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            for name in scenarios:
+                seconds, action = SCENARIOS[name]
+                # Fresh context per scenario so caches/GC state from the previous one don't leak in
+                context = await browser.new_context(viewport=VIEWPORT)
+                page = await new_instrumented_page(context)
+                page.on("pageerror", lambda exc: print(f"PAGE ERROR: {exc}"))
+                await page.goto(url)
+                load_ms = await wait_for_game_ready(page)
+                await start_game(page)
+
+                merged = {"frames": [], "renderFrames": [], "longTasks": [], "heap": []}
+                for _ in range(runs):
+                    sample = await record(page, seconds, action)
+                    for key in merged:
+                        merged[key] += sample.get(key, [])
+                summary = summarize_frames(merged)
+                summary["ready_ms"] = round(load_ms)
+                results[name] = summary
+                print(f"{name:10} {summary.get('avg_fps', 0):6.1f} fps  p95 {summary.get('p95_ms', 0):6.1f} ms  "
+                      f"p99 {summary.get('p99_ms', 0):6.1f} ms  dropped {summary.get('dropped_frames', 0)}  "
+                      f"long tasks {summary.get('long_tasks', 0)}")
+                await context.close()
+        finally:
+            await browser.close()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark (rAF sampler on SwiftShader) with baseline comparison.")
+    parser.add_argument("--mode", choices=["dev", "preview"], default="dev", help="Serve with `npm run dev` or `npm run preview`")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Run only these scenarios (repeatable)")
+    parser.add_argument("--runs", type=int, default=1, help="Repeat each scenario's sample window this many times")
+    parser.add_argument("--baseline", help=f"Baseline JSON to compare against (default: {BASELINE_PATH}); must exist when given")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed fractional regression")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--require-baseline", action="store_true", help="Fail instead of only recording results when there is no baseline (CI)")
+    parser.add_argument("--out", help="Results JSON (default: perf_results/frame_time-<timestamp>.json)")
+    args = parser.parse_args()
+
+    with DevServer(args.mode) as server:
+        results = asyncio.run(run(server.url, args.scenario or list(SCENARIOS), args.runs))
+
+    write_json(args.out or timestamped("frame_time"), results)
+
+    baseline_path = args.baseline or BASELINE_PATH
+    if args.update_baseline:
+        write_json(baseline_path, results)
+        sys.exit(0)
+
+    baseline = load_json(baseline_path)
+    if baseline is None:
+        print(f"No baseline at {baseline_path}, nothing to compare; run with --update-baseline on this setup to create one")
+        # An explicit --baseline is a request to compare, so a missing file is an error there too
+        sys.exit(1 if args.require_baseline or args.baseline else 0)
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for r in regressions:
+            print(f"  {r}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.tolerance:.0%} against {baseline_path}")
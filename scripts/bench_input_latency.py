@@ -0,0 +1,175 @@
+import asyncio
+import argparse
+from playwright.async_api import async_playwright
+
+from perf_harness import (
+    DevServer, VIEWPORT, launch_browser, new_instrumented_page, wait_for_game_ready, start_game,
+    percentile, write_json, timestamped,
+)
+
+# Measures input -> first rendered frame that reflects it, using the DebugHooks frame log
+# (window.__PFISO_DEBUG__.frames). Two latencies per input:
+#   consumed: first frame where InputManager's state shows the input (axis/action set)
+#   visible:  first frame whose player position / camera rotation changed because of it
+# Inputs are dispatched through CDP so they go through the browser's real input pipeline.
+
+# Configuration
+RATES_HZ = [2, 5, 10, 20]
+INPUTS_PER_RATE = 20
+TIMEOUT_MS = 500  # no reflecting frame within this counts as a missed input
+POSITION_EPSILON = 1e-3
+ROTATION_EPSILON = 1e-4
+SETTLE_S = 0.5
+
+# Records when each input event reached the page. Registered from an init script, so it runs
+# before InputManager's listeners; event.timeStamp shares performance.now()'s time origin.
+INPUT_LOG_JS = """
+(() => {
+  const log = window.__inputLog = [];
+  for (const type of ['keydown', 'keyup', 'mousedown', 'mouseup', 'mousemove']) {
+    window.addEventListener(type, (e) => log.push({ type, t: e.timeStamp }), { capture: true });
+  }
+})();
+"""
+
+KEYS = {
+    "w": {"key": "w", "code": "KeyW", "windowsVirtualKeyCode": 87},
+    "s": {"key": "s", "code": "KeyS", "windowsVirtualKeyCode": 83},
+    "space": {"key": " ", "code": "Space", "windowsVirtualKeyCode": 32},
+}
+
+def moved(a, b):
+    return max(abs(x - y) for x, y in zip(a["player"], b["player"])) > POSITION_EPSILON
+
+def rotated(a, b):
+    return max(abs(x - y) for x, y in zip(a["camera"], b["camera"])) > ROTATION_EPSILON
+
+async def key_tap(cdp, key, hold_s):
+    await cdp.send("Input.dispatchKeyEvent", {"type": "keyDown", **KEYS[key]})
+    await asyncio.sleep(hold_s)
+    await cdp.send("Input.dispatchKeyEvent", {"type": "keyUp", **KEYS[key]})
+
+async def move_input(cdp, i, hold_s):
+    # Alternate forward/back so the player stays near the spawn point
+    await key_tap(cdp, "w" if i % 2 == 0 else "s", hold_s)
+
+async def jump_input(cdp, i, hold_s):
+    await key_tap(cdp, "space", hold_s)
+
+async def look_input(cdp, i, hold_s):
+    cx, cy = VIEWPORT["width"] // 2, VIEWPORT["height"] // 2
+    dx = 40 if i % 2 == 0 else -40
+    await cdp.send("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": cx + dx, "y": cy})
+
+async def click_input(cdp, i, hold_s):
+    cx, cy = VIEWPORT["width"] // 2, VIEWPORT["height"] // 2
+    await cdp.send("Input.dispatchMouseEvent", {"type": "mousePressed", "x": cx, "y": cy, "button": "left", "clickCount": 1})
+    await asyncio.sleep(hold_s)
+    await cdp.send("Input.dispatchMouseEvent", {"type": "mouseReleased", "x": cx, "y": cy, "button": "left", "clickCount": 1})
+
+# Input kind -> (dispatch, event that starts it, consumed predicate, visible predicate or None)
+INPUT_KINDS = {
+    "move": (move_input, "keydown", lambda f: f["moveY"] != 0, moved),
+    # Player.tsx keeps its own 100 ms jump buffer; useInputBuffer has no callers yet
+    "jump": (jump_input, "keydown", lambda f: f["jump"], moved),
+    "look": (look_input, "mousemove", lambda f: f["lookX"] != 0, rotated),
+    "click": (click_input, "mousedown", lambda f: f["primary"], None),
+}
+
+def measure(events, frames, consumed, visible):
+    """Latency from each event to the first frame satisfying each predicate."""
+    results = []
+    for i, t in enumerate(events):
+        deadline = min(t + TIMEOUT_MS, events[i + 1] if i + 1 < len(events) else t + TIMEOUT_MS)
+        before = [f for f in frames if f["t"] <= t]
+        after = [f for f in frames if t < f["t"] <= t + TIMEOUT_MS]
+        entry = {"consumed_ms": None, "visible_ms": None}
+
+        hit = next((f for f in after if f["t"] <= deadline and consumed(f)), None)
+        if hit:
+            entry["consumed_ms"] = round(hit["t"] - t, 2)
+
+        # Only meaningful when the player/camera was at rest, otherwise any frame "changes"
+        if visible and len(before) >= 2 and not visible(before[-2], before[-1]):
+            hit = next((f for f in after if visible(before[-1], f)), None)
+            if hit:
+                entry["visible_ms"] = round(hit["t"] - t, 2)
+        results.append(entry)
+    return results
+
+def distribution(values):
+    if not values:
+        return None
+    return {
+        "n": len(values),
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "max_ms": round(max(values), 2),
+    }
+
+async def run_kind(page, cdp, kind, rate):
+    dispatch, event_type, consumed, visible = INPUT_KINDS[kind]
+    interval = 1.0 / rate
+    hold = min(0.1, interval / 2)
+
+    await page.evaluate("() => { window.__inputLog.length = 0 }")
+    start = await page.evaluate("() => performance.now()")
+    for i in range(INPUTS_PER_RATE):
+        began = asyncio.get_running_loop().time()
+        await dispatch(cdp, i, hold)
+        await asyncio.sleep(max(0.0, interval - (asyncio.get_running_loop().time() - began)))
+    await asyncio.sleep(TIMEOUT_MS / 1000)
+
+    log = await page.evaluate("() => window.__inputLog")
+    frames = await page.evaluate("(since) => window.__PFISO_DEBUG__.frames(since)", start - 1000)
+    events = [e["t"] for e in log if e["type"] == event_type]
+    samples = measure(events, frames, consumed, visible)
+
+    consumed_ms = [s["consumed_ms"] for s in samples if s["consumed_ms"] is not None]
+    visible_ms = [s["visible_ms"] for s in samples if s["visible_ms"] is not None]
+    return {
+        "inputs": len(events),
+        "missed": len(events) - len(consumed_ms),
+        "consumed": distribution(consumed_ms),
+        "visible": distribution(visible_ms),
+    }
+
+async def run(url, kinds, rates):
+    results = {}
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            context = await browser.new_context(viewport=VIEWPORT)
+            await context.add_init_script(INPUT_LOG_JS)
+            page = await new_instrumented_page(context, debug_hooks=True)
+            await page.goto(url)
+            await wait_for_game_ready(page)
+            await start_game(page)
+            await page.wait_for_function("() => window.__PFISO_DEBUG__ && window.__PFISO_DEBUG__.frame > 0")
+            cdp = await context.new_cdp_session(page)
+
+            for kind in kinds:
+                results[kind] = {}
+                for rate in rates:
+                    await asyncio.sleep(SETTLE_S)  # let the player come to rest between runs
+                    r = await run_kind(page, cdp, kind, rate)
+                    results[kind][f"{rate}hz"] = r
+                    c, v = r["consumed"] or {}, r["visible"] or {}
+                    print(f"{kind:6} {rate:3d} Hz  consumed p50 {c.get('p50_ms', '-'):>7} p95 {c.get('p95_ms', '-'):>7}  "
+                          f"visible p50 {v.get('p50_ms', '-'):>7} p95 {v.get('p95_ms', '-'):>7}  missed {r['missed']}/{r['inputs']}")
+            await context.close()
+        finally:
+            await browser.close()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Input-to-frame latency for keyboard and pointer input at several input rates.")
+    parser.add_argument("--mode", choices=["dev", "preview"], default="dev", help="Serve with `npm run dev` or `npm run preview`")
+    parser.add_argument("--kind", action="append", choices=list(INPUT_KINDS), help="Only these input kinds (repeatable)")
+    parser.add_argument("--rate", action="append", type=int, help=f"Input rates in Hz (default: {RATES_HZ})")
+    parser.add_argument("--out", help="Results JSON (default: perf_results/input_latency-<timestamp>.json)")
+    args = parser.parse_args()
+
+    with DevServer(args.mode) as server:
+        results = asyncio.run(run(server.url, args.kind or list(INPUT_KINDS), args.rate or RATES_HZ))
+    write_json(args.out or timestamped("input_latency"), results)
@@ -0,0 +1,133 @@
+import os
+import io
+import json
+import base64
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+# Configuration
+PUBLIC_DIR = "public"
+PROJECTS_JSON = os.path.join("src", "assets", "data", "projects.json")
+VARIANT_WIDTHS = [320, 480, 640, 960]
+WEBP_QUALITY = 80
+LQIP_WIDTH = 16 # Placeholder is upscaled + blurred by the browser, keep it tiny
+IMAGE_EXTENSIONS = (".webp", ".png", ".jpg", ".jpeg")
+
+def is_image_path(value):
+    return isinstance(value, str) and value.startswith("./assets/") and value.lower().endswith(IMAGE_EXTENSIONS)
+
+def collect_image_paths(node, found):
+    # heroImage, designProcess.userFlows/wireframes/mockups, research.personas...
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "imageVariants":
+                continue
+            collect_image_paths(value, found)
+    elif isinstance(node, list):
+        for value in node:
+            collect_image_paths(value, found)
+    elif is_image_path(node) and node not in found:
+        found.append(node)
+    return found
+
+def to_disk_path(asset_path):
+    # "./assets/projects/p1/hero.webp" -> "public/assets/projects/p1/hero.webp"
+    return os.path.join(PUBLIC_DIR, *asset_path[2:].split("/"))
+
+def variant_asset_path(asset_path, width):
+    stem, _ = os.path.splitext(asset_path)
+    return f"{stem}-{width}w.webp"
+
+def compute_lqip(img):
+    # Area-average downscale in NumPy so the placeholder matches the overall colour
+    # distribution instead of picking up aliasing from a nearest-neighbour resize.
+    rgb = np.asarray(img.convert("RGB"), dtype=np.float32)
+    h, w, _ = rgb.shape
+    out_w = min(LQIP_WIDTH, w)
+    out_h = max(1, round(h * out_w / w))
+
+    # Integer bin edges along each axis, then sum each block via cumulative sums
+    ys = np.linspace(0, h, out_h + 1).astype(int)
+    xs = np.linspace(0, w, out_w + 1).astype(int)
+    integral = np.zeros((h + 1, w + 1, 3), dtype=np.float64)
+    integral[1:, 1:] = rgb.cumsum(0).cumsum(1)
+
+    y0, y1 = ys[:-1, None], ys[1:, None]
+    x0, x1 = xs[None, :-1], xs[None, 1:]
+    sums = integral[y1, x1] - integral[y0, x1] - integral[y1, x0] + integral[y0, x0]
+    area = ((y1 - y0) * (x1 - x0))[..., None]
+    small = np.clip(sums / np.maximum(area, 1), 0, 255).astype(np.uint8)
+
+    buf = io.BytesIO()
+    Image.fromarray(small, "RGB").save(buf, "WEBP", quality=40)
+    data_uri = "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+    mean = rgb.reshape(-1, 3).mean(0).astype(int)
+    color = "#{:02x}{:02x}{:02x}".format(*mean)
+    return data_uri, color
+
+def process_image(asset_path):
+    disk_path = to_disk_path(asset_path)
+    img = Image.open(disk_path)
+    img.load()
+    width, height = img.size
+
+    srcset = []
+    for target in VARIANT_WIDTHS:
+        if target >= width:
+            break
+        variant_h = max(1, round(height * target / width))
+        variant = img.resize((target, variant_h), Image.LANCZOS)
+        out_path = variant_asset_path(asset_path, target)
+        variant.save(to_disk_path(out_path), "WEBP", quality=WEBP_QUALITY)
+        srcset.append({"src": out_path, "width": target})
+
+    # The original is always the largest candidate
+    srcset.append({"src": asset_path, "width": width})
+
+    placeholder, color = compute_lqip(img)
+    return asset_path, {
+        "width": width,
+        "height": height,
+        "srcset": srcset,
+        "placeholder": placeholder,
+        "color": color
+    }
+
+def build_responsive_images():
+    with open(PROJECTS_JSON, "r", encoding="utf-8") as f:
+        projects = json.load(f)
+
+    unique_paths = []
+    for project in projects:
+        collect_image_paths(project, unique_paths)
+
+    missing = [p for p in unique_paths if not os.path.exists(to_disk_path(p))]
+    for p in missing:
+        print(f"Missing source image, skipping: {p}")
+    unique_paths = [p for p in unique_paths if p not in missing]
+
+    # Resizing + encoding is CPU bound, fan it out over a process pool
+    with ProcessPoolExecutor() as pool:
+        results = dict(pool.map(process_image, unique_paths))
+
+    for asset_path, meta in results.items():
+        print(f"{asset_path}: {meta['width']}x{meta['height']}, {len(meta['srcset'])} candidates")
+
+    for project in projects:
+        paths = collect_image_paths(project, [])
+        variants = {p: results[p] for p in paths if p in results}
+        if variants:
+            project["imageVariants"] = variants
+        else:
+            project.pop("imageVariants", None)
+
+    with open(PROJECTS_JSON, "w", encoding="utf-8") as f:
+        json.dump(projects, f, indent=2, ensure_ascii=False)
+
+    print(f"Wrote responsive variants for {len(results)} images into {PROJECTS_JSON}")
+
+if __name__ == "__main__":
+    build_responsive_images()
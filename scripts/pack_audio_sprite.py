@@ -0,0 +1,264 @@
+import os
+import sys
+import json
+import argparse
+
+# Configuration
+AUDIO_DIR = "public/assets/audio"
+SPRITE_NAME = "memories"
+# SoundBank.tsx picks the manifest up at build time; no file means no sprite request
+MANIFEST_PATH = "src/assets/data/audio_sprite.json"
+# Same ids SoundBank.tsx loads, in playback-independent order
+CLIP_IDS = ['mem-work-1', 'mem-proj-1', 'mem-skill-1', 'mem-contact-1']
+
+# MPEG audio frame header tables (ISO 11172-3 / 13818-3)
+# Version bits: 0 = MPEG 2.5, 1 = reserved, 2 = MPEG 2, 3 = MPEG 1
+# Layer bits:   1 = Layer III, 2 = Layer II, 3 = Layer I, 0 = reserved
+MPEG1, MPEG2, MPEG25 = 3, 2, 0
+LAYER3, LAYER2, LAYER1 = 1, 2, 3
+
+# Every Layer III decoder outputs 529 samples of filterbank delay before the first encoded sample
+# (528 + 1, the value LAME and mpg123 use for gapless playback). The Info frame that tells a
+# browser to trim it is dropped from the sprite, so the offsets have to account for it.
+DECODER_DELAY = 529
+# Encoders that write the LAME extension after the Xing/Info tag (LAME itself, ffmpeg's libmp3lame)
+LAME_ENCODERS = (b"LAME", b"Lavc", b"Lavf")
+
+BITRATES = {
+    (MPEG1, LAYER1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (MPEG1, LAYER2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (MPEG1, LAYER3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (MPEG2, LAYER1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (MPEG2, LAYER2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (MPEG2, LAYER3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+SAMPLE_RATES = {
+    MPEG1: [44100, 48000, 32000],
+    MPEG2: [22050, 24000, 16000],
+    MPEG25: [11025, 12000, 8000],
+}
+
+class Mp3Error(Exception):
+    pass
+
+def parse_frame_header(data, pos):
+    """Decode the 4-byte header at pos. Returns None if it is not a valid frame sync."""
+    if pos + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[pos], data[pos + 1], data[pos + 2], data[pos + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 0x03
+    padding = (b2 >> 1) & 0x01
+    channel_mode = b3 >> 6
+
+    # Reserved / free-format / bad values
+    if version == 1 or layer == 0 or bitrate_idx in (0, 15) or rate_idx == 3:
+        return None
+
+    table_version = MPEG1 if version == MPEG1 else MPEG2
+    bitrate = BITRATES[(table_version, layer)][bitrate_idx] * 1000
+    sample_rate = SAMPLE_RATES[version][rate_idx]
+
+    if layer == LAYER1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == LAYER2 or version == MPEG1:
+        samples = 1152
+        length = 144 * bitrate // sample_rate + padding
+    else:
+        # MPEG 2 / 2.5 Layer III carries half as many samples per frame
+        samples = 576
+        length = 72 * bitrate // sample_rate + padding
+
+    return {
+        'version': version,
+        'layer': layer,
+        'bitrate': bitrate,
+        'sample_rate': sample_rate,
+        'channels': 1 if channel_mode == 3 else 2,
+        'samples': samples,
+        'length': length,
+    }
+
+def skip_id3v2(data):
+    # "ID3" + version(2) + flags(1) + syncsafe size(4)
+    if len(data) >= 10 and data[:3] == b"ID3":
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+def xing_offset(pos, header):
+    # The Xing/Info tag sits right after the side information of the first frame
+    if header['version'] == MPEG1:
+        side_info = 17 if header['channels'] == 1 else 32
+    else:
+        side_info = 9 if header['channels'] == 1 else 17
+    return pos + 4 + side_info
+
+def is_info_frame(data, pos, header):
+    # Xing/Info/VBRI frames hold the source file's length + seek table. They would be
+    # wrong for the sprite, so drop them and let the decoder treat the sprite as CBR/VBR.
+    tag = xing_offset(pos, header)
+    return data[tag:tag + 4] in (b"Xing", b"Info") or data[pos + 36:pos + 40] == b"VBRI"
+
+def parse_lame_tag(data, pos, header):
+    """Encoder delay and end padding (in samples) from the LAME extension of an Info frame.
+
+    Returns None when the frame has no LAME extension (VBRI, or a bare Xing tag).
+    """
+    tag = xing_offset(pos, header)
+    if data[tag:tag + 4] not in (b"Xing", b"Info"):
+        return None
+    flags = int.from_bytes(data[tag + 4:tag + 8], "big")
+    # Optional fields, in order: frame count, byte count, 100-entry TOC, quality
+    lame = tag + 8 + sum(size for bit, size in ((1, 4), (2, 4), (4, 100), (8, 4)) if flags & bit)
+    if data[lame:lame + 4] not in LAME_ENCODERS or lame + 24 > pos + header['length']:
+        return None
+    # 9-byte version string, revision/VBR method, lowpass, peak(4), radio/audiophile gain(2+2),
+    # flags, ABR bitrate, then delay and padding packed as two 12-bit values
+    b0, b1, b2 = data[lame + 21:lame + 24]
+    return {'encoderDelay': (b0 << 4) | (b1 >> 4), 'padding': ((b1 & 0x0F) << 8) | b2}
+
+def read_frames(path):
+    """Split an MP3 file into its raw audio frames (no decoding)."""
+    return read_stream(path)[0]
+
+def read_stream(path):
+    """Audio frames plus the LAME encoder delay/padding of the dropped Info frame, if any."""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    end = len(data)
+    if end >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128  # ID3v1 trailer
+
+    pos = skip_id3v2(data)
+    frames = []
+    info = None
+    gapless = None
+
+    while pos < end:
+        header = parse_frame_header(data, pos)
+        # A sync word only counts if it is followed by another frame (or EOF), which
+        # filters out 0xFFE patterns that happen to appear in junk between frames.
+        if header and pos + header['length'] <= end:
+            next_pos = pos + header['length']
+            if next_pos == end or parse_frame_header(data, next_pos) or next_pos + 4 > end:
+                if not frames and info is None and is_info_frame(data, pos, header):
+                    info = header
+                    gapless = parse_lame_tag(data, pos, header)
+                else:
+                    if frames and (header['sample_rate'] != frames[0][0]['sample_rate'] or header['channels'] != frames[0][0]['channels']):
+                        raise Mp3Error(f"{path}: stream format changes mid-file at byte {pos}")
+                    frames.append((header, data[pos:next_pos]))
+                pos = next_pos
+                continue
+        pos += 1
+
+    if not frames:
+        raise Mp3Error(f"{path}: no MPEG audio frames found")
+    return frames, gapless
+
+def pack_audio_sprite(audio_dir, clip_ids, sprite_name, manifest_path=MANIFEST_PATH):
+    clips = []
+    for clip_id in clip_ids:
+        path = os.path.join(audio_dir, f"{clip_id}.mp3")
+        if not os.path.exists(path):
+            print(f"Missing {path}, skipping")
+            continue
+        try:
+            clips.append((clip_id, *read_stream(path)))
+        except Mp3Error as e:
+            print(f"Skipping {clip_id}: {e}")
+
+    if not clips:
+        print("No valid MP3 clips found; sprite not written.")
+        return None
+
+    # Frames can only be concatenated when every clip shares one stream format,
+    # otherwise the decoder would have to re-sync (and Web Audio refuses the file).
+    first = clips[0][1][0][0]
+    fmt = (first['version'], first['layer'], first['sample_rate'], first['channels'])
+    for clip_id, frames, _ in clips:
+        h = frames[0][0]
+        if (h['version'], h['layer'], h['sample_rate'], h['channels']) != fmt:
+            raise Mp3Error(
+                f"{clip_id} is {h['sample_rate']}Hz/{h['channels']}ch, expected "
+                f"{first['sample_rate']}Hz/{first['channels']}ch; re-export it before packing"
+            )
+
+    sample_rate = first['sample_rate']
+    sprite_path = os.path.join(audio_dir, f"{sprite_name}.mp3")
+    mapping = {}
+    sample_cursor = 0
+
+    with open(sprite_path, 'wb') as out:
+        for clip_id, frames, gapless in clips:
+            samples = sum(h['samples'] for h, _ in frames)
+            mapping[clip_id] = {
+                'start': sample_cursor / sample_rate,
+                'duration': samples / sample_rate,
+                'frames': len(frames),
+            }
+            if gapless:
+                # Silence the encoder added in front of / after the clip, in samples
+                mapping[clip_id].update(gapless)
+            for _, raw in frames:
+                out.write(raw)
+            sample_cursor += samples
+
+    manifest = {
+        'src': f"./assets/audio/{sprite_name}.mp3",
+        'sampleRate': sample_rate,
+        'channels': first['channels'],
+        'samplesPerFrame': first['samples'],
+        # start/duration are frame aligned; the decoded clip begins decoderDelay (+ the clip's
+        # encoderDelay) samples later and ends its padding samples early
+        'decoderDelay': DECODER_DELAY if first['layer'] == LAYER3 else 0,
+        'sprites': mapping,
+    }
+    os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    verify_sprite(sprite_path, manifest)
+    print(f"Packed {len(mapping)} clips ({sample_cursor / sample_rate:.2f}s) into {sprite_path}")
+    return manifest
+
+def verify_sprite(sprite_path, manifest):
+    """Re-parse the written sprite and check frame counts/offsets line up with the map."""
+    frames = read_frames(sprite_path)
+    expected = sum(c['frames'] for c in manifest['sprites'].values())
+    if len(frames) != expected:
+        raise Mp3Error(f"Sprite has {len(frames)} frames, offset map expects {expected}")
+
+    spf = manifest['samplesPerFrame']
+    rate = manifest['sampleRate']
+    frame_cursor = 0
+    for clip_id, clip in manifest['sprites'].items():
+        if abs(clip['start'] - frame_cursor * spf / rate) > 1e-9:
+            raise Mp3Error(f"{clip_id}: start {clip['start']} does not sit on frame {frame_cursor}")
+        if abs(clip['duration'] - clip['frames'] * spf / rate) > 1e-9:
+            raise Mp3Error(f"{clip_id}: duration does not match {clip['frames']} frames")
+        frame_cursor += clip['frames']
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concatenate MP3 clips into one audio sprite at frame boundaries.")
+    parser.add_argument("--dir", default=AUDIO_DIR, help="Directory containing <id>.mp3 clips")
+    parser.add_argument("--name", default=SPRITE_NAME, help="Output sprite basename")
+    parser.add_argument("--manifest", default=MANIFEST_PATH, help="Where to write the offset map SoundBank.tsx imports")
+    parser.add_argument("ids", nargs="*", default=CLIP_IDS, help="Clip ids to pack, in order")
+    args = parser.parse_args()
+
+    try:
+        pack_audio_sprite(args.dir, args.ids, args.name, args.manifest)
+    except Mp3Error as e:
+        print(f"Error: {e}")
+        sys.exit(1)
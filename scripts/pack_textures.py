@@ -0,0 +1,145 @@
+import os
+import json
+import argparse
+
+import numpy as np
+from PIL import Image
+
+# Configuration
+OUTPUT_DIR = "public/assets/textures"
+# Tier map is app data (imported by OfficeAssets.tsx), so it lives next to projects.json
+MANIFEST_PATH = "src/assets/data/textures.json"
+# Tier -> max edge. HIGH matches the ARTREQ spec (1024x1024), LOW is what the mobile path loads.
+TIERS = {"high": 1024, "medium": 512, "low": 256}
+# Normal maps are always lossless: lossy WebP's chroma subsampling and block noise bend the
+# vectors, which shows up as lighting artifacts. Lower ORM tiers (mobile / reduced presets) are
+# lossy, where transfer size matters more than a little roughness/AO noise.
+LOSSY_QUALITY = 90
+
+# Material maps to process. ORM inputs are optional; any missing channel is filled with
+# the constant the material would otherwise use (AO 1.0, metalness 0.0).
+MATERIALS = {
+    "fabric": {"normal": "public/assets/fabric_normal.png"},
+    "keyboard": {"normal": "public/assets/keyboard_normal.png"},
+}
+
+ORM_DEFAULTS = {"ao": 1.0, "roughness": 0.8, "metalness": 0.0}
+
+def load_gray(path, size):
+    img = Image.open(path).convert("L")
+    if img.size != (size, size):
+        img = img.resize((size, size), Image.LANCZOS)
+    return np.asarray(img, dtype=np.float32) / 255.0
+
+def pack_orm(maps, size):
+    """Channel-pack occlusion/roughness/metalness into one RGB texture.
+
+    Layout follows glTF / three.js: aoMap reads R, roughnessMap reads G, metalnessMap reads B,
+    so the same texture can be bound to all three material slots.
+    """
+    channels = []
+    for key in ("ao", "roughness", "metalness"):
+        path = maps.get(key)
+        if path:
+            channels.append(load_gray(path, size))
+        else:
+            channels.append(np.full((size, size), ORM_DEFAULTS[key], dtype=np.float32))
+    orm = np.stack(channels, axis=-1)
+    return Image.fromarray(np.round(orm * 255).astype(np.uint8), "RGB")
+
+def decode_normals(img):
+    rgb = np.asarray(img.convert("RGB"), dtype=np.float32) / 255.0
+    return rgb * 2.0 - 1.0
+
+def encode_normals(n):
+    return Image.fromarray(np.round((n * 0.5 + 0.5) * 255).clip(0, 255).astype(np.uint8), "RGB")
+
+def normalize(n):
+    length = np.linalg.norm(n, axis=-1, keepdims=True)
+    # Fully degenerate texels (e.g. black padding) become a flat +Z normal
+    flat = length[..., 0] < 1e-6
+    n = n / np.maximum(length, 1e-6)
+    n[flat] = (0.0, 0.0, 1.0)
+    return n
+
+def downsample_normals(n):
+    # 2x2 box filter on the vectors, then renormalize. Averaging encoded RGB and resizing
+    # with PIL shortens the vectors, which reads as flattened, too-smooth bumps at distance.
+    h, w, _ = n.shape
+    if h % 2 or w % 2:
+        n = n[:h - h % 2, :w - w % 2]
+    n = 0.25 * (n[0::2, 0::2] + n[1::2, 0::2] + n[0::2, 1::2] + n[1::2, 1::2])
+    return normalize(n)
+
+def build_normal_tiers(path, tiers):
+    n = normalize(decode_normals(Image.open(path)))
+    out = {}
+    for tier, edge in sorted(tiers.items(), key=lambda t: -t[1]):
+        while max(n.shape[:2]) > edge and min(n.shape[:2]) > 1:
+            n = downsample_normals(n)
+        out[tier] = encode_normals(n)
+    return out
+
+def build_orm_tiers(maps, tiers):
+    base = pack_orm(maps, max(tiers.values()))
+    out = {}
+    for tier, edge in tiers.items():
+        out[tier] = base if base.width <= edge else base.resize((edge, edge), Image.LANCZOS)
+    return out
+
+def pack_textures(materials, output_dir, tiers, manifest_path=MANIFEST_PATH):
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {}
+
+    for name, maps in materials.items():
+        entry = {}
+        if maps.get("normal"):
+            source_size = Image.open(maps["normal"]).size
+            for tier, img in build_normal_tiers(maps["normal"], tiers).items():
+                if img.size == source_size:
+                    # Re-encoding at full size only adds bytes, point the tier at the source
+                    entry.setdefault("normal", {})[tier] = to_asset_path(maps["normal"])
+                else:
+                    entry.setdefault("normal", {})[tier] = save_tier(img, output_dir, f"{name}_normal_{tier}.webp", True)
+        if any(maps.get(k) for k in ("ao", "roughness", "metalness")):
+            for tier, img in build_orm_tiers(maps, tiers).items():
+                entry.setdefault("orm", {})[tier] = save_tier(img, output_dir, f"{name}_orm_{tier}.webp", tier == "high")
+        manifest[name] = entry
+        print(f"Packed {name}: {', '.join(entry) or 'nothing'}")
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {len(manifest)} materials to {output_dir}, tier map to {manifest_path}")
+    return manifest
+
+def to_asset_path(path):
+    # "public/assets/fabric_normal.png" -> "./assets/fabric_normal.png"
+    rel = os.path.relpath(path, "public").replace(os.sep, "/")
+    return f"./{rel}"
+
+def save_tier(img, output_dir, filename, lossless):
+    path = os.path.join(output_dir, filename)
+    if lossless:
+        img.save(path, "WEBP", lossless=True)
+    else:
+        img.save(path, "WEBP", quality=LOSSY_QUALITY, method=6)
+    return f"./assets/textures/{filename}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Channel-pack ORM maps and build low/medium/high texture tiers.")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Output directory")
+    parser.add_argument("--manifest", default=MANIFEST_PATH, help="Where to write the tier map")
+    parser.add_argument("--material", help="Pack only this material instead of the built-in list")
+    parser.add_argument("--normal", help="Normal map for --material")
+    parser.add_argument("--ao", help="Ambient occlusion map for --material")
+    parser.add_argument("--roughness", help="Roughness map for --material")
+    parser.add_argument("--metalness", help="Metalness map for --material")
+    args = parser.parse_args()
+
+    materials = dict(MATERIALS)
+    if args.material:
+        materials = {args.material: {
+            "normal": args.normal, "ao": args.ao, "roughness": args.roughness, "metalness": args.metalness,
+        }}
+
+    pack_textures(materials, args.out, TIERS, args.manifest)
@@ -0,0 +1,278 @@
+import os
+import json
+import time
+import math
+import asyncio
+import socket
+import subprocess
+
+# Shared plumbing for the Playwright performance tools in scripts/ (bench_*.py, run_verifications.py, ...)
+
+# Configuration
+DEV_URL = "http://localhost:5173/"
+PREVIEW_URL = "http://localhost:4173/PFISO/"
+RESULTS_DIR = "perf_results"
+
+# Headless Chromium has no GPU; SwiftShader gives a deterministic software WebGL so numbers
+# are comparable between machines/CI runs (same flags verify_fix.py uses).
+CHROMIUM_ARGS = [
+    "--use-gl=swiftshader",
+    "--enable-webgl",
+    "--ignore-gpu-blocklist",
+    "--enable-precise-memory-info",  # unbucketed performance.memory for heap sampling
+]
+
+READY_TIMEOUT_MS = 60000
+# Desktop viewport for every tool that is not emulating a device
+VIEWPORT = {"width": 1280, "height": 720}
+
+# Injected before any page script runs. Samples every requestAnimationFrame, long tasks and the
+# JS heap into window.__perf; nothing is recorded until __perf.start() so load time is excluded.
+# FPSLimiter renders on its own rAF loop at 30/60 fps, so most ticks draw nothing and raw rAF
+# intervals over-report FPS. three.js clears the canvas at the start of every render, so a tick
+# that follows a gl.clear() marks a rendered frame; the sampler's rAF callback is registered
+# first, so it sees the previous tick's render and every interval is shifted by the same amount.
+FRAME_SAMPLER_JS = """
+(() => {
+  if (window.__perf) return;
+  const perf = window.__perf = {
+    recording: false, frames: [], renderFrames: [], longTasks: [], heap: [], last: 0, lastRender: 0,
+    drew: false, heapTimer: null,
+    start() {
+      this.frames = []; this.renderFrames = []; this.longTasks = []; this.heap = [];
+      this.last = 0; this.lastRender = 0; this.recording = true;
+      const sampleHeap = () => {
+        if (performance.memory) this.heap.push([performance.now(), performance.memory.usedJSHeapSize]);
+      };
+      sampleHeap();
+      this.heapTimer = setInterval(sampleHeap, 1000);
+    },
+    stop() {
+      this.recording = false;
+      clearInterval(this.heapTimer);
+      return { frames: this.frames, renderFrames: this.renderFrames, longTasks: this.longTasks, heap: this.heap };
+    }
+  };
+  for (const ctx of [window.WebGLRenderingContext, window.WebGL2RenderingContext]) {
+    if (!ctx) continue;
+    const clear = ctx.prototype.clear;
+    ctx.prototype.clear = function (mask) {
+      perf.drew = true;
+      return clear.call(this, mask);
+    };
+  }
+  const tick = (t) => {
+    if (perf.recording) {
+      if (perf.last) perf.frames.push(t - perf.last);
+      perf.last = t;
+      if (perf.drew) {
+        if (perf.lastRender) perf.renderFrames.push(t - perf.lastRender);
+        perf.lastRender = t;
+      }
+    }
+    perf.drew = false;
+    requestAnimationFrame(tick);
+  };
+  requestAnimationFrame(tick);
+  try {
+    new PerformanceObserver((list) => {
+      if (!perf.recording) return;
+      for (const e of list.getEntries()) perf.longTasks.push([e.startTime, e.duration]);
+    }).observe({ type: 'longtask', buffered: false });
+  } catch (e) { /* longtask unsupported */ }
+})();
+"""
+
+# Installs window.__PFISO_DEBUG__ (src/components/debug/DebugHooks.tsx). Only for tools that need
+# the frame log or its actions; the hooks record every rendered frame, which the frame-time and
+# profiling numbers should not include.
+DEBUG_HOOKS_JS = "window.__PFISO_DEBUG_HOOKS__ = true;"
+
+# Counts how often the in-scene "<n>% READY" loader has been mounted. "Loader gone" only means
+# the game is ready once the loader has been seen: before the lazy scene chunk suspends, and
+# between two polls of a fast load, the page has no loader either.
+LOADER_TRACKER_JS = """
+(() => {
+  if (window.__loader) return;
+  const loader = window.__loader = { shown: 0 };
+  new MutationObserver((records) => {
+    for (const r of records) {
+      for (const node of r.addedNodes) {
+        if (/\\d+% READY/.test(node.textContent)) {
+          loader.shown++;
+          return;
+        }
+      }
+    }
+  }).observe(document, { childList: true, subtree: true });
+})();
+"""
+
+# The in-scene loader renders "<n>% READY"; the game is interactive once it is gone.
+LOADER_GONE_JS = "() => !/\\d+% READY/.test(document.body.innerText)"
+LOADER_DONE_JS = f"(seen) => window.__loader.shown > seen && ({LOADER_GONE_JS})()"
+
+def base_url(mode):
+    return PREVIEW_URL if mode == "preview" else DEV_URL
+
+def port_open(url):
+    host_port = url.split("//", 1)[1].split("/", 1)[0]
+    host, port = host_port.split(":")
+    with socket.socket() as s:
+        s.settimeout(0.5)
+        return s.connect_ex((host, int(port))) == 0
+
+class DevServer:
+    """Starts `npm run dev` / `npm run preview` unless something already listens on the port."""
+
+    def __init__(self, mode="dev"):
+        self.mode = mode
+        self.url = base_url(mode)
+        self.proc = None
+
+    def __enter__(self):
+        if port_open(self.url):
+            print(f"Using server already running at {self.url}")
+            return self
+        cmd = ["npm", "run", "preview" if self.mode == "preview" else "dev", "--", "--strictPort"]
+        print(f"Starting {' '.join(cmd)} ...")
+        self.proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.time() + 60
+        while not port_open(self.url):
+            if self.proc.poll() is not None or time.time() > deadline:
+                raise RuntimeError(f"Server did not come up at {self.url}")
+            time.sleep(0.25)
+        return self
+
+    def __exit__(self, *exc):
+        if self.proc:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+async def launch_browser(playwright, headless=True):
+    return await playwright.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+
+async def new_instrumented_page(context, debug_hooks=False):
+    page = await context.new_page()
+    if debug_hooks:
+        await page.add_init_script(DEBUG_HOOKS_JS)
+    await page.add_init_script(FRAME_SAMPLER_JS)
+    await page.add_init_script(LOADER_TRACKER_JS)
+    return page
+
+async def wait_for_game_ready(page, timeout=READY_TIMEOUT_MS, seen=0):
+    """Event-based readiness instead of fixed sleeps: canvas attached, loader shown and dismissed.
+
+    Needs LOADER_TRACKER_JS (new_instrumented_page installs it). `seen` is the loader count to
+    wait past, for waits after the first load.
+    """
+    started = time.perf_counter()
+    await page.wait_for_selector("canvas", state="attached", timeout=timeout)
+    await page.wait_for_function(LOADER_DONE_JS, arg=seen, timeout=timeout)
+    # Wait for two real frames so the first post-load compile doesn't land in a sample window
+    await page.evaluate("() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))")
+    return (time.perf_counter() - started) * 1000
+
+async def start_game(page, timeout=5000):
+    # MainMenu gates gameplay behind "Start Journey"; click it when present
+    button = page.get_by_role("button", name="Start Journey")
+    try:
+        await button.first.click(timeout=timeout, force=True)
+    except Exception:
+        pass
+
+async def record(page, seconds, action=None):
+    """Record frames/long tasks/heap for `seconds` while optionally running an input coroutine."""
+    await page.evaluate("() => window.__perf.start()")
+    if action is not None:
+        await asyncio.gather(action(page), asyncio.sleep(seconds))
+    else:
+        await asyncio.sleep(seconds)
+    return await page.evaluate("() => window.__perf.stop()")
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo, hi = math.floor(k), math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+def summarize_frames(sample):
+    # Rendered-frame intervals; raw rAF intervals only if nothing was drawn (e.g. no WebGL)
+    frames = sample.get("renderFrames") or sample["frames"]
+    if not frames:
+        return {"frames": 0}
+    total = sum(frames)
+    median = percentile(frames, 50)
+    # A frame that takes N times the typical interval means N-1 presentations were missed.
+    # Relative to the median so FPSLimiter's cap is not counted as dropping.
+    dropped = sum(max(0, round(f / median) - 1) for f in frames) if median else 0
+    heap = [h for _, h in sample.get("heap", [])]
+    return {
+        "frames": len(frames),
+        "avg_fps": round(1000 * len(frames) / total, 2),
+        "p50_ms": round(median, 2),
+        "p90_ms": round(percentile(frames, 90), 2),
+        "p95_ms": round(percentile(frames, 95), 2),
+        "p99_ms": round(percentile(frames, 99), 2),
+        "max_ms": round(max(frames), 2),
+        "dropped_frames": dropped,
+        "long_tasks": len(sample.get("longTasks", [])),
+        "long_task_ms": round(sum(d for _, d in sample.get("longTasks", [])), 2),
+        "heap_start_mb": round(heap[0] / 2**20, 2) if heap else None,
+        "heap_end_mb": round(heap[-1] / 2**20, 2) if heap else None,
+        "heap_peak_mb": round(max(heap) / 2**20, 2) if heap else None,
+    }
+
+# Metric -> direction that counts as worse
+REGRESSION_DIRECTIONS = {
+    "avg_fps": "lower",
+    "p95_ms": "higher",
+    "p99_ms": "higher",
+    "dropped_frames": "higher",
+    "long_task_ms": "higher",
+}
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Returns human-readable regressions for metrics worse than baseline by more than tolerance."""
+    regressions = []
+    for scenario, metrics in results.items():
+        base = baseline.get(scenario)
+        if not base:
+            continue
+        for key, direction in REGRESSION_DIRECTIONS.items():
+            if key not in base or metrics.get(key) is None:
+                continue
+            old, new = base[key], metrics[key]
+            if direction == "lower":
+                worse = new < old * (1 - tolerance)
+            else:
+                # Small absolute slack so a baseline of 0 dropped frames isn't tripped by 1
+                worse = new > old * (1 + tolerance) + (1 if key == "dropped_frames" else 0)
+            if worse:
+                regressions.append(f"{scenario}.{key}: {new} vs baseline {old}")
+    return regressions
+
+def describe_error(e):
+    """One-line "Type: first line of message" for result tables; Playwright errors span many lines."""
+    message = str(e)
+    return f"{type(e).__name__}: {message.splitlines()[0] if message else ''}"
+
+def load_json(path, default=None):
+    if not path or not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    print(f"Results written to {path}")
+
+def timestamped(name):
+    return os.path.join(RESULTS_DIR, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.json")
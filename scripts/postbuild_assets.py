@@ -0,0 +1,230 @@
+import os
+import re
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+import fnmatch
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Configuration
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PUBLIC_DIR = os.path.join(REPO_ROOT, "public")
+DIST_DIR = "dist"
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LENGTH = 8
+
+# Assets produced by the Python tools (pack_sprites, build_responsive_images, pack_textures,
+# pack_audio_sprite). Vite already hashes its own bundles; these are copied from public/ verbatim.
+FINGERPRINT_PATTERNS = [
+    "assets/atlas/*",
+    "assets/projects/*/*",
+    "assets/textures/*",
+    "assets/audio/memories.*",
+]
+
+# Vite's own output: assets/<name>-<hash>.<ext>. A file copied from public/ could match by
+# accident (any "-" followed by 8 name characters), so those are ruled out by path.
+VITE_HASHED = re.compile(r"^assets/[^/]+-[\w-]{%d}\.[^./]+$" % HASH_LENGTH)
+
+# Files whose contents may reference other assets by path
+TEXT_EXTENSIONS = (".js", ".mjs", ".css", ".html", ".json", ".svg", ".txt", ".webmanifest")
+COMPRESS_EXTENSIONS = TEXT_EXTENSIONS + (".wasm", ".map", ".xml", ".glb", ".gltf", ".bin")
+MIN_COMPRESS_BYTES = 1024
+# Keep a compressed sibling only if it saves at least this fraction of the original
+MIN_SAVINGS = 0.1
+
+def list_files(dist_dir):
+    for dirpath, _, filenames in os.walk(dist_dir):
+        for name in filenames:
+            if name.endswith((".gz", ".br")) or name == MANIFEST_NAME:
+                continue
+            path = os.path.join(dirpath, name)
+            yield os.path.relpath(path, dist_dir).replace(os.sep, "/")
+
+def content_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()[:HASH_LENGTH]
+
+def is_fingerprinted(rel):
+    # Re-running on an already processed dist/ must not hash names twice
+    return re.search(r"\.[0-9a-f]{%d}\.[^./]+$" % HASH_LENGTH, rel) is not None
+
+def is_vite_hashed(rel, public_dir=PUBLIC_DIR):
+    return VITE_HASHED.match(rel) is not None and not os.path.exists(os.path.join(public_dir, rel))
+
+def fingerprinted_name(rel, digest):
+    stem, ext = os.path.splitext(rel)
+    return f"{stem}.{digest}{ext}"
+
+def reference_pattern(rel):
+    # Match the path however it is written ("./assets/x", "/PFISO/assets/x", BASE_URL + "assets/x")
+    # but not as part of a longer name, e.g. hero.webp inside hero-320w.webp or hero.webp.map.
+    return re.compile(r"(?<![\w.-])" + re.escape(rel) + r"(?![\w.-])")
+
+def rewrite_references(dist_dir, renames):
+    if not renames:
+        return 0
+    patterns = [(reference_pattern(old), new) for old, new in renames.items()]
+    touched = 0
+    for rel in list_files(dist_dir):
+        if not rel.endswith(TEXT_EXTENSIONS):
+            continue
+        path = os.path.join(dist_dir, rel)
+        with open(path, "r", encoding="utf-8", errors="surrogateescape") as f:
+            text = f.read()
+        updated = text
+        for pattern, new in patterns:
+            updated = pattern.sub(new, updated)
+        if updated != text:
+            with open(path, "w", encoding="utf-8", errors="surrogateescape") as f:
+                f.write(updated)
+            touched += 1
+    return touched
+
+def fingerprint_assets(dist_dir, patterns):
+    candidates = sorted(
+        rel for rel in list_files(dist_dir)
+        if any(fnmatch.fnmatch(rel, p) for p in patterns) and not is_fingerprinted(rel)
+    )
+    # Binary assets first, then text assets (e.g. sprites.json -> sprites.webp), so a text
+    # asset is hashed only after the references inside it point at their final names.
+    binaries = [r for r in candidates if not r.endswith(TEXT_EXTENSIONS)]
+    texts = [r for r in candidates if r.endswith(TEXT_EXTENSIONS)]
+
+    renames = {}
+    for group in (binaries, texts):
+        group_renames = {}
+        for rel in group:
+            new_rel = fingerprinted_name(rel, content_hash(os.path.join(dist_dir, rel)))
+            os.replace(os.path.join(dist_dir, rel), os.path.join(dist_dir, new_rel))
+            group_renames[rel] = new_rel
+        touched = rewrite_references(dist_dir, group_renames)
+        print(f"Fingerprinted {len(group_renames)} files, rewrote references in {touched}")
+        renames.update(group_renames)
+    return renames
+
+def rehash_bundles(dist_dir, asset_names, public_dir=PUBLIC_DIR):
+    """Rename Vite bundles whose contents now point at fingerprinted assets.
+
+    Vite hashed each bundle before the rewrite, so when only a public/ asset changes the bundle
+    keeps its name but points at a new asset name; a browser caching it as immutable would
+    request one that no longer exists. The new hash covers Vite's name plus every asset name
+    reachable through the bundle's imports. Imports can be circular, so this is a closure over
+    the import graph rather than a re-hash in dependency order.
+    """
+    bundles = {}
+    for rel in list_files(dist_dir):
+        if rel.endswith(TEXT_EXTENSIONS) and is_vite_hashed(rel, public_dir):
+            with open(os.path.join(dist_dir, rel), "r", encoding="utf-8", errors="surrogateescape") as f:
+                bundles[rel] = f.read()
+
+    asset_patterns = [(name, reference_pattern(name)) for name in asset_names]
+    # Bundles import each other by basename ("./Lobby-<hash>.js", "/PFISO/assets/index-<hash>.js")
+    bundle_patterns = [(rel, reference_pattern(os.path.basename(rel))) for rel in bundles]
+    direct = {rel: {name for name, p in asset_patterns if p.search(text)} for rel, text in bundles.items()}
+    imports = {rel: {other for other, p in bundle_patterns if other != rel and p.search(text)}
+               for rel, text in bundles.items()}
+
+    renames = {}
+    for rel in sorted(bundles):
+        reachable, seen, stack = set(), {rel}, [rel]
+        while stack:
+            current = stack.pop()
+            reachable |= direct[current]
+            for other in imports[current] - seen:
+                seen.add(other)
+                stack.append(other)
+        if not reachable:
+            continue
+        digest = hashlib.sha256("\n".join([rel] + sorted(reachable)).encode()).hexdigest()[:HASH_LENGTH]
+        new_rel = re.sub(r"-[\w-]{%d}(\.[^./]+)$" % HASH_LENGTH, lambda m: f"-{digest}{m.group(1)}", rel)
+        os.replace(os.path.join(dist_dir, rel), os.path.join(dist_dir, new_rel))
+        renames[os.path.basename(rel)] = os.path.basename(new_rel)
+
+    touched = rewrite_references(dist_dir, renames)
+    print(f"Re-hashed {len(renames)} bundles that reference fingerprinted assets, rewrote references in {touched}")
+    return renames
+
+def compress_file(args):
+    dist_dir, rel = args
+    path = os.path.join(dist_dir, rel)
+    with open(path, "rb") as f:
+        data = f.read()
+
+    result = {"bytes": len(data)}
+    variants = [("gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(("br", lambda d: brotli.compress(d, quality=11)))
+
+    for ext, compress in variants:
+        sibling = f"{path}.{ext}"
+        packed = compress(data)
+        if len(packed) <= len(data) * (1 - MIN_SAVINGS):
+            with open(sibling, "wb") as f:
+                f.write(packed)
+            result[ext] = len(packed)
+        elif os.path.exists(sibling):
+            os.remove(sibling)  # stale sibling from an earlier run
+    return rel, result
+
+def precompress(dist_dir):
+    jobs = []
+    for rel in list_files(dist_dir):
+        if rel.endswith(COMPRESS_EXTENSIONS) and os.path.getsize(os.path.join(dist_dir, rel)) >= MIN_COMPRESS_BYTES:
+            jobs.append((dist_dir, rel))
+
+    # Brotli q11 is slow; spread files over a process pool
+    with ProcessPoolExecutor() as pool:
+        results = dict(pool.map(compress_file, jobs))
+
+    kept = sum(1 for r in results.values() if "gz" in r or "br" in r)
+    print(f"Precompressed {kept}/{len(jobs)} files (skipped where savings < {MIN_SAVINGS:.0%})")
+    if brotli is None:
+        print("brotli module not installed; only .gz siblings were written (pip install brotli)")
+    return results
+
+def postbuild_assets(dist_dir, patterns, public_dir=PUBLIC_DIR):
+    if not os.path.isdir(dist_dir):
+        print(f"{dist_dir} not found, run `npm run build` first")
+        return None
+
+    renames = fingerprint_assets(dist_dir, patterns)
+    if renames:
+        rehash_bundles(dist_dir, renames.values(), public_dir)
+    compressed = precompress(dist_dir)
+
+    manifest = {}
+    for rel in sorted(list_files(dist_dir)):
+        entry = {"file": rel, "bytes": os.path.getsize(os.path.join(dist_dir, rel))}
+        original = rel
+        if is_fingerprinted(rel):
+            # Safe for Cache-Control: immutable, the name changes whenever the content does
+            original = re.sub(r"\.[0-9a-f]{%d}(\.[^./]+)$" % HASH_LENGTH, r"\1", rel)
+            entry["immutable"] = True
+        elif is_vite_hashed(rel, public_dir):
+            entry["immutable"] = True
+        entry.update({k: v for k, v in compressed.get(rel, {}).items() if k in ("gz", "br")})
+        manifest[original] = entry
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {os.path.join(dist_dir, MANIFEST_NAME)}")
+    return manifest
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fingerprint generated assets and write .br/.gz siblings after `vite build`.")
+    parser.add_argument("dist", nargs="?", default=DIST_DIR, help="Build output directory")
+    args = parser.parse_args()
+
+    if postbuild_assets(args.dist, FINGERPRINT_PATTERNS) is None:
+        sys.exit(1)
@@ -0,0 +1,167 @@
+import os
+import re
+import sys
+import json
+import argparse
+from html import escape
+
+# Configuration
+PROJECTS_JSON = os.path.join("src", "assets", "data", "projects.json")
+BIO_JSON = os.path.join("src", "assets", "data", "bio.json")
+INDEX_HTML = os.path.join("dist", "index.html")
+
+START_MARKER = "<!-- prerender:start -->"
+END_MARKER = "<!-- prerender:end -->"
+
+# Removed by LoadingScreen.tsx once the first scene has loaded
+SNAPSHOT_ID = "prerender-snapshot"
+
+# Critical CSS for the snapshot only. Everything is scoped to #prerender and uses system fonts,
+# because the pixel fonts and index.css are not loaded yet when this paints. It sits above the
+# canvas and the loader, so visitors can read and scroll it while the game loads underneath.
+CRITICAL_CSS = """
+#prerender{position:fixed;inset:0;z-index:2147483647;overflow-y:auto;touch-action:pan-y;-webkit-user-select:text;user-select:text;
+background:#fffcf5;color:#4a403a;font:16px/1.6 system-ui,-apple-system,"Segoe UI",Roboto,sans-serif;-webkit-font-smoothing:auto}
+#prerender .pr-wrap{max-width:960px;margin:0 auto;padding:24px 20px 64px}
+#prerender header{display:flex;gap:16px;align-items:center;border-bottom:2px solid #eaddcf;padding-bottom:16px}
+#prerender header img{width:64px;height:64px;border-radius:8px;image-rendering:pixelated}
+#prerender h1{font-size:28px;line-height:1.2;margin:0}
+#prerender h2{font-size:20px;margin:32px 0 12px;border-bottom:2px solid #eaddcf;padding-bottom:6px}
+#prerender h3{font-size:18px;line-height:1.4;margin:0 0 8px;color:#8c6a4a}
+#prerender .pr-role{margin:4px 0 0;color:#8c6a4a}
+#prerender .pr-grid{display:grid;gap:20px;grid-template-columns:repeat(auto-fill,minmax(280px,1fr))}
+#prerender article{background:#fff;border:2px solid #eaddcf;border-radius:12px;overflow:hidden}
+#prerender article img{display:block;width:100%;height:auto;aspect-ratio:2/1;object-fit:cover;background-size:cover}
+#prerender article .pr-body{padding:16px}
+#prerender ul.pr-tags{display:flex;flex-wrap:wrap;gap:6px;list-style:none;padding:0;margin:8px 0 0}
+#prerender ul.pr-tags li{background:#f3ebe1;border-radius:4px;padding:2px 8px;font-size:13px}
+#prerender .pr-note{font-size:14px;color:#8c6a4a}
+""".strip()
+
+def inline_markdown(text):
+    # The data only uses **bold** (e.g. "**My Role**: ..."), so that is all we render
+    return re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", escape(text))
+
+def render_image(path, alt, variants=None, sizes=None, eager=False):
+    attrs = [f'src="{escape(path)}"', f'alt="{escape(alt)}"']
+    if variants:
+        srcset = ", ".join(f"{escape(v['src'])} {v['width']}w" for v in variants["srcset"])
+        attrs.append(f'srcset="{srcset}"')
+        if sizes:
+            attrs.append(f'sizes="{sizes}"')
+        attrs.append(f'width="{variants["width"]}" height="{variants["height"]}"')
+        if variants.get("placeholder"):
+            attrs.append(f'style="background-color:{variants.get("color", "#eee")};'
+                         f'background-image:url({variants["placeholder"]})"')
+    # Only the first card is likely above the fold on phones
+    attrs.append('fetchpriority="high"' if eager else 'loading="lazy"')
+    attrs.append('decoding="async"')
+    return f"<img {' '.join(attrs)}>"
+
+def render_project(project, eager):
+    hero = project.get("heroImage")
+    variants = project.get("imageVariants", {}).get(hero) if hero else None
+    parts = ["<article>"]
+    if hero:
+        parts.append(render_image(hero, project["title"], variants, "(max-width: 640px) 100vw, 320px", eager))
+    parts.append('<div class="pr-body">')
+    parts.append(f"<h3>{escape(project['title'])}</h3>")
+    parts.append(f"<p>{escape(project.get('description', ''))}</p>")
+    if project.get("role"):
+        parts.append(f'<p class="pr-note">{inline_markdown(project["role"])}</p>')
+    if project.get("timeline"):
+        parts.append(f'<p class="pr-note"><strong>Timeline:</strong> {escape(project["timeline"])}</p>')
+    metrics = project.get("outcomes", {}).get("metrics", [])
+    if metrics:
+        parts.append("<ul>" + "".join(f"<li>{escape(m)}</li>" for m in metrics) + "</ul>")
+    if project.get("techStack"):
+        parts.append('<ul class="pr-tags">' + "".join(f"<li>{escape(t)}</li>" for t in project["techStack"]) + "</ul>")
+    parts.append("</div></article>")
+    return "".join(parts)
+
+def render_content(projects, bio):
+    out = [f'<main id="prerender" aria-label="{escape(bio["name"])} portfolio"><div class="pr-wrap">']
+
+    out.append("<header>")
+    if bio.get("avatar"):
+        out.append(f'<img src="{escape(bio["avatar"])}" alt="" width="64" height="64">')
+    out.append(f"<div><h1>{escape(bio['name'])}</h1>"
+               f"<p class=\"pr-role\">{escape(bio.get('role', ''))} &middot; {escape(bio.get('headline', ''))}</p></div>")
+    out.append("</header>")
+
+    if bio.get("valueProposition"):
+        out.append(f"<p>{escape(bio['valueProposition'])}</p>")
+
+    out.append('<section aria-labelledby="pr-projects"><h2 id="pr-projects">Projects</h2><div class="pr-grid">')
+    # Featured work first, same as the in-game project board
+    ordered = sorted(projects, key=lambda p: not p.get("featured", False))
+    out.extend(render_project(p, eager=(i == 0)) for i, p in enumerate(ordered))
+    out.append("</div></section>")
+
+    if bio.get("experience"):
+        out.append('<section aria-labelledby="pr-experience"><h2 id="pr-experience">Experience</h2><ul>')
+        out.extend(f"<li><strong>{escape(e['role'])}</strong>, {escape(e['company'])} ({escape(e['years'])})</li>"
+                   for e in bio["experience"])
+        out.append("</ul></section>")
+
+    if bio.get("skills"):
+        out.append('<section aria-labelledby="pr-skills"><h2 id="pr-skills">Skills</h2>')
+        for cat in bio["skills"]:
+            out.append(f"<h3>{escape(cat['category'])}</h3>")
+            out.append('<ul class="pr-tags">' + "".join(f"<li>{escape(i['name'])}</li>" for i in cat["items"]) + "</ul>")
+        out.append("</section>")
+
+    if bio.get("summary"):
+        out.append('<section aria-labelledby="pr-about"><h2 id="pr-about">About</h2>')
+        out.extend(f"<p>{escape(p)}</p>" for p in bio["summary"])
+        out.append("</section>")
+
+    if bio.get("certifications"):
+        out.append('<section aria-labelledby="pr-certs"><h2 id="pr-certs">Certifications</h2><ul>')
+        out.extend(f"<li>{escape(c['name'])} &ndash; {escape(c['issuer'])}, {escape(c['date'])}</li>"
+                   for c in bio["certifications"])
+        out.append("</ul></section>")
+
+    out.append('<p class="pr-note">Loading the interactive office&hellip;</p>')
+    out.append("</div></main>")
+    return "".join(out)
+
+def inject(html, content):
+    block = (f'{START_MARKER}<div id="{SNAPSHOT_ID}"><style>{CRITICAL_CSS}</style>{content}</div>'
+             f'{END_MARKER}')
+
+    # Re-running replaces the previous snapshot instead of stacking a second one
+    if START_MARKER in html:
+        return re.sub(re.escape(START_MARKER) + ".*?" + re.escape(END_MARKER), lambda _: block, html, flags=re.DOTALL)
+
+    # Next to #root, not inside it: createRoot().render() would swap it out on the first commit,
+    # long before the scene is ready. LoadingScreen removes it when the loader goes away.
+    root = re.search(r'<div id="root">\s*</div>', html)
+    if not root:
+        raise ValueError('index.html has no empty <div id="root"></div> to render next to')
+    return html[:root.end()] + block + html[root.end():]
+
+def prerender_content(index_path, projects_path=PROJECTS_JSON, bio_path=BIO_JSON):
+    with open(projects_path, "r", encoding="utf-8") as f:
+        projects = json.load(f)
+    with open(bio_path, "r", encoding="utf-8") as f:
+        bio = json.load(f)
+    with open(index_path, "r", encoding="utf-8") as f:
+        html = f.read()
+
+    content = render_content(projects, bio)
+    html = inject(html, content)
+
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"Injected {len(content) + len(CRITICAL_CSS)} bytes of pre-rendered content into {index_path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render portfolio content into the built index.html.")
+    parser.add_argument("index", nargs="?", default=INDEX_HTML, help="Built index.html (run after `vite build`, before postbuild_assets.py)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.index):
+        print(f"{args.index} not found, run `npm run build` first")
+        sys.exit(1)
+    prerender_content(args.index)
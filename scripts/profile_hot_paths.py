@@ -0,0 +1,282 @@
+import os
+import re
+import sys
+import json
+import base64
+import asyncio
+import argparse
+from html import escape
+from playwright.async_api import async_playwright
+
+from perf_harness import (
+    DevServer, VIEWPORT, launch_browser, new_instrumented_page, wait_for_game_ready, start_game, record,
+    summarize_frames, load_json, write_json, timestamped,
+)
+from bench_frame_time import walk, look, dash_jump
+
+# Configuration
+SAMPLING_INTERVAL_US = 200
+TOP_N = 40
+# Per-frame systems we want attributed by name in every report
+SYSTEMS = ["GameLoop", "PhysicsSafety", "ProjectileSystem", "InteractionManager", "TelemetryManager"]
+TRACE_CATEGORIES = ",".join([
+    "devtools.timeline",
+    "v8",
+    "disabled-by-default-v8.gc",
+])
+# Trace event names the DevTools performance panel shows as Minor/Major GC
+GC_EVENTS = {"MinorGC": "minor", "MajorGC": "major"}
+# Pseudo-frames V8 reports with no URL
+IDLE = "(idle)"
+
+async def interact(page):
+    # Walk up to things and press the interact keys InputManager binds (F / Enter), then click
+    # the canvas, which exercises InteractionManager and the projectile path.
+    for key in ("w", "d"):
+        await page.keyboard.down(key)
+        await asyncio.sleep(1.0)
+        await page.keyboard.up(key)
+        await page.keyboard.press("f")
+        await page.keyboard.press("Enter")
+        await asyncio.sleep(0.3)
+    for i in range(10):
+        await page.mouse.click(VIEWPORT["width"] // 2 + (i - 5) * 30, VIEWPORT["height"] // 2)
+        await asyncio.sleep(0.2)
+
+# Walkthrough step -> (seconds, input coroutine)
+WALKTHROUGH = [
+    ("idle", 3, None),
+    ("walk", 6, walk),
+    ("look", 6, look),
+    ("dash_jump", 5, dash_jump),
+    ("interact", 5, interact),
+]
+
+def source_file(url):
+    # "http://localhost:5173/src/systems/GameLoop.tsx?t=1700" -> "src/systems/GameLoop.tsx"
+    if not url:
+        return "(native)"
+    path = re.sub(r"^[a-z-]+://[^/]+/", "", url).split("?", 1)[0]
+    return re.sub(r"^PFISO/", "", path) or url
+
+def aggregate_profile(profile):
+    """Self and total (inclusive) time per function and per file from a V8 CPU profile.
+
+    Inclusive time is counted once per sample per key, so recursion doesn't inflate it.
+    """
+    nodes = {n["id"]: n for n in profile["nodes"]}
+    parent = {}
+    for n in profile["nodes"]:
+        for child in n.get("children", []):
+            parent[child] = n["id"]
+
+    def keys(node):
+        frame = node["callFrame"]
+        fn = frame["functionName"] or "(anonymous)"
+        if not frame["url"] and fn.startswith("("):
+            return fn, fn  # (program), (garbage collector), (idle), (root)
+        f = source_file(frame["url"])
+        return f"{fn} {f}:{frame['lineNumber'] + 1}", f
+
+    functions, files = {}, {}
+    idle_ms = 0.0
+    deltas = profile.get("timeDeltas", [])
+    samples = profile.get("samples", [])
+    # timeDeltas[i] is the gap *before* sample i; attribute the gap after it instead, so the
+    # last sample gets no time rather than the first one getting the profiler start-up gap
+    for i, node_id in enumerate(samples):
+        ms = (deltas[i + 1] if i + 1 < len(deltas) else 0) / 1000.0
+        node = nodes[node_id]
+        fn_key, file_key = keys(node)
+        if fn_key == IDLE:
+            idle_ms += ms
+            continue
+        functions.setdefault(fn_key, {"self_ms": 0.0, "total_ms": 0.0, "file": file_key})["self_ms"] += ms
+        files.setdefault(file_key, {"self_ms": 0.0, "total_ms": 0.0})["self_ms"] += ms
+
+        seen_fn, seen_file = set(), set()
+        current = node_id
+        while current is not None:
+            fn_key, file_key = keys(nodes[current])
+            if fn_key != "(root)":
+                if fn_key not in seen_fn:
+                    seen_fn.add(fn_key)
+                    functions.setdefault(fn_key, {"self_ms": 0.0, "total_ms": 0.0, "file": file_key})["total_ms"] += ms
+                if file_key not in seen_file:
+                    seen_file.add(file_key)
+                    files.setdefault(file_key, {"self_ms": 0.0, "total_ms": 0.0})["total_ms"] += ms
+            current = parent.get(current)
+
+    return functions, files, idle_ms
+
+def ranked(table, limit=None):
+    rows = [{"name": k, **{f: (round(v, 2) if isinstance(v, float) else v) for f, v in d.items()}}
+            for k, d in table.items()]
+    rows.sort(key=lambda r: -r["self_ms"])
+    return rows[:limit] if limit else rows
+
+def system_breakdown(files):
+    out = {}
+    for system in SYSTEMS:
+        # InteractionManager exists under both systems/ and components/game/
+        matches = {f: d for f, d in files.items() if os.path.splitext(os.path.basename(f))[0] == system}
+        out[system] = {
+            "files": sorted(matches),
+            "self_ms": round(sum((d["self_ms"] for d in matches.values()), 0.0), 2),
+            "total_ms": round(sum((d["total_ms"] for d in matches.values()), 0.0), 2),
+        }
+    return out
+
+def gc_pauses(trace_events):
+    pauses = {"minor": [], "major": []}
+    for e in trace_events:
+        kind = GC_EVENTS.get(e.get("name"))
+        if kind and e.get("ph") == "X" and "dur" in e:
+            pauses[kind].append(e["dur"] / 1000.0)
+    out = {}
+    for kind, durations in pauses.items():
+        out[kind] = {
+            "count": len(durations),
+            "total_ms": round(sum(durations, 0.0), 2),
+            "max_ms": round(max(durations), 2) if durations else 0.0,
+        }
+    return out
+
+async def read_stream(cdp, handle):
+    chunks = []
+    while True:
+        part = await cdp.send("IO.read", {"handle": handle})
+        data = part["data"]
+        chunks.append(base64.b64decode(data).decode("utf-8") if part.get("base64Encoded") else data)
+        if part.get("eof"):
+            break
+    await cdp.send("IO.close", {"handle": handle})
+    return "".join(chunks)
+
+async def profile_walkthrough(url):
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            context = await browser.new_context(viewport=VIEWPORT)
+            page = await new_instrumented_page(context)
+            await page.goto(url)
+            await wait_for_game_ready(page)
+            await start_game(page)
+
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Profiler.enable")
+            await cdp.send("Profiler.setSamplingInterval", {"interval": SAMPLING_INTERVAL_US})
+            trace_done = asyncio.get_running_loop().create_future()
+            cdp.on("Tracing.tracingComplete", lambda e: trace_done.done() or trace_done.set_result(e))
+            await cdp.send("Tracing.start", {"categories": TRACE_CATEGORIES, "transferMode": "ReturnAsStream"})
+            await cdp.send("Profiler.start")
+
+            frames = {}
+            for name, seconds, action in WALKTHROUGH:
+                print(f"  {name} ({seconds}s)")
+                frames[name] = summarize_frames(await record(page, seconds, action))
+
+            profile = (await cdp.send("Profiler.stop"))["profile"]
+            await cdp.send("Tracing.end")
+            complete = await trace_done
+            trace = json.loads(await read_stream(cdp, complete["stream"]))
+            await context.close()
+        finally:
+            await browser.close()
+
+    trace_events = trace["traceEvents"] if isinstance(trace, dict) else trace
+    return profile, trace_events, frames
+
+def build_report(profile, trace_events, frames, url):
+    functions, files, idle_ms = aggregate_profile(profile)
+    busy_ms = sum(d["self_ms"] for d in files.values())
+    return {
+        "url": url,
+        "duration_ms": round((profile["endTime"] - profile["startTime"]) / 1000.0, 2),
+        "busy_ms": round(busy_ms, 2),
+        "idle_ms": round(idle_ms, 2),
+        "gc": gc_pauses(trace_events),
+        "systems": system_breakdown(files),
+        "frames": frames,
+        "files": ranked(files),
+        "functions": ranked(functions, TOP_N * 5),
+    }
+
+def render_html(report):
+    def table(title, rows, cols):
+        head = "".join(f"<th>{c}</th>" for c in cols)
+        body = "".join(
+            "<tr>" + "".join(f"<td>{escape(str(r.get(c, '')))}</td>" for c in cols) + "</tr>" for r in rows)
+        return f"<h2>{title}</h2><table><tr>{head}</tr>{body}</table>"
+
+    systems = [{"name": k, **v, "files": ", ".join(v["files"])} for k, v in report["systems"].items()]
+    gc = [{"name": k, **v} for k, v in report["gc"].items()]
+    return (
+        "<!doctype html><meta charset=utf-8><title>Hot-path profile</title>"
+        "<style>body{font:14px system-ui;margin:24px}table{border-collapse:collapse;margin-bottom:24px}"
+        "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}td:nth-child(n+2){font-variant-numeric:tabular-nums}</style>"
+        f"<h1>Hot-path profile</h1><p>{escape(report['url'])} &middot; {report['duration_ms']} ms recorded, "
+        f"{report['busy_ms']} ms busy, {report['idle_ms']} ms idle</p>"
+        + table("Systems", systems, ["name", "self_ms", "total_ms", "files"])
+        + table("GC pauses", gc, ["name", "count", "total_ms", "max_ms"])
+        + table("Files by self time", report["files"][:TOP_N], ["name", "self_ms", "total_ms"])
+        + table("Functions by self time", report["functions"][:TOP_N], ["name", "self_ms", "total_ms"])
+    )
+
+def diff_reports(old, new, limit=TOP_N):
+    """Print the biggest self-time changes between two reports, per system then per function."""
+    print(f"{'system':24} {'old ms':>10} {'new ms':>10} {'delta':>10}")
+    for name in SYSTEMS:
+        a = old["systems"].get(name, {}).get("self_ms", 0.0)
+        b = new["systems"].get(name, {}).get("self_ms", 0.0)
+        print(f"{name:24} {a:10.2f} {b:10.2f} {b - a:+10.2f}")
+    for kind in ("minor", "major"):
+        a, b = old["gc"][kind]["total_ms"], new["gc"][kind]["total_ms"]
+        print(f"{kind + ' GC':24} {a:10.2f} {b:10.2f} {b - a:+10.2f}")
+
+    before = {r["name"]: r["self_ms"] for r in old["functions"]}
+    after = {r["name"]: r["self_ms"] for r in new["functions"]}
+    deltas = sorted(((after.get(k, 0.0) - before.get(k, 0.0), k) for k in set(before) | set(after)),
+                    key=lambda d: -abs(d[0]))
+    print(f"\n{'delta ms':>10}  function")
+    for delta, name in deltas[:limit]:
+        print(f"{delta:+10.2f}  {name}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record a CDP CPU profile + trace over a scripted walkthrough and attribute time per file/function.")
+    parser.add_argument("--mode", choices=["dev", "preview"], default="dev",
+                        help="dev keeps per-module URLs (src/systems/*.tsx); preview attributes to bundles only")
+    parser.add_argument("--out", help="Report JSON (default: perf_results/profile-<timestamp>.json); HTML is written alongside")
+    parser.add_argument("--raw", action="store_true", help="Also save the .cpuprofile (opens in DevTools)")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="Compare two existing reports instead of profiling")
+    args = parser.parse_args()
+
+    if args.diff:
+        old, new = (load_json(path) for path in args.diff)
+        if old is None or new is None:
+            print("Both reports must exist")
+            sys.exit(1)
+        diff_reports(old, new)
+        sys.exit(0)
+
+    with DevServer(args.mode) as server:
+        print("Profiling walkthrough...")
+        profile, trace_events, frames = asyncio.run(profile_walkthrough(server.url))
+        report = build_report(profile, trace_events, frames, server.url)
+
+    out = args.out or timestamped("profile")
+    write_json(out, report)
+    html_path = os.path.splitext(out)[0] + ".html"
+    with open(html_path, "w") as f:
+        f.write(render_html(report))
+    print(f"HTML report written to {html_path}")
+    if args.raw:
+        with open(os.path.splitext(out)[0] + ".cpuprofile", "w") as f:
+            json.dump(profile, f)
+
+    print(f"\n{'system':24} {'self ms':>10} {'total ms':>10}")
+    for name, s in report["systems"].items():
+        print(f"{name:24} {s['self_ms']:10.2f} {s['total_ms']:10.2f}")
+    gc = report["gc"]
+    print(f"GC: {gc['minor']['count']} minor ({gc['minor']['total_ms']} ms), "
+          f"{gc['major']['count']} major ({gc['major']['total_ms']} ms, max {gc['major']['max_ms']} ms)")
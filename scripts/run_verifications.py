@@ -0,0 +1,128 @@
+import os
+import sys
+import time
+import asyncio
+import argparse
+from playwright.async_api import async_playwright, expect
+
+from perf_harness import (
+    DevServer, LOADER_TRACKER_JS, RESULTS_DIR, VIEWPORT, launch_browser, wait_for_game_ready, describe_error,
+    write_json, timestamped,
+)
+
+# Runs the checks from verify_*.py / debug_*.py concurrently, one browser context each, against a
+# single dev/preview server. Readiness is event based (canvas attached, "% READY" loader gone),
+# so nothing waits on time.sleep.
+#
+# verify_ui.py's project modal and verify_mobile.py's HUD contact button are not ported: both live
+# in the Lobby's GlobalHUD, and App always renders Level_01 outside the debug hooks, so players
+# never see that UI.
+
+# Configuration
+# Untracked (perf_results/ is ignored), so runs don't rewrite the committed verification/ images
+SCREENSHOT_DIR = os.path.join(RESULTS_DIR, "verification")
+SCENARIO_TIMEOUT_S = 120
+
+async def check_core(page, url):
+    # verify_core.py
+    await page.goto(url)
+    await page.wait_for_selector("canvas", state="attached")
+    title = await page.title()
+    assert title, "document has no title"
+    return {"title": title}
+
+async def check_game_ready(page, url):
+    # verify_fix.py, verify_physics.py, verification/verify_fixes.py, debug_deployment.py
+    await page.goto(url)
+    ready_ms = await wait_for_game_ready(page)
+    await expect(page.locator("canvas").first).to_be_visible()
+    await page.screenshot(path=os.path.join(SCREENSHOT_DIR, "verification.png"))
+    return {"ready_ms": round(ready_ms)}
+
+async def check_main_menu(page, url):
+    await page.goto(url)
+    await wait_for_game_ready(page)
+    start = page.get_by_role("button", name="Start Journey")
+    await expect(start).to_be_visible()
+    await start.click()
+    # MainMenu unmounts 500 ms after gameState leaves 'menu'
+    await expect(start).to_have_count(0, timeout=5000)
+
+async def check_mobile_portrait(page, url):
+    # verify_mobile.py: the portrait layout lists projects/skills below a 40vh canvas
+    await page.goto(url)
+    await wait_for_game_ready(page)
+    await page.get_by_role("button", name="▲ Projects").click()
+    await expect(page.get_by_role("heading", name="Projects", exact=True)).to_be_visible()
+    await page.locator(".mobile-content-list").evaluate("el => el.scrollTo(0, el.scrollHeight)")
+    await expect(page.get_by_role("heading", name="Skills", exact=True)).to_be_visible()
+    await page.screenshot(path=os.path.join(SCREENSHOT_DIR, "mobile_main.png"))
+
+# Scenario -> (check coroutine, Playwright device name or None for a VIEWPORT-sized desktop)
+SCENARIOS = {
+    "core": (check_core, None),
+    "game_ready": (check_game_ready, None),
+    "main_menu": (check_main_menu, None),
+    "mobile_portrait": (check_mobile_portrait, "Pixel 5"),
+}
+
+async def run_scenario(p, browser, name, url, semaphore):
+    check, device = SCENARIOS[name]
+    options = dict(p.devices[device]) if device else {"viewport": dict(VIEWPORT)}
+    async with semaphore:
+        context = await browser.new_context(**options)
+        page = await context.new_page()
+        await page.add_init_script(LOADER_TRACKER_JS)
+        page_errors = []
+        page.on("pageerror", lambda exc: page_errors.append(str(exc)))
+
+        started = time.perf_counter()
+        result = {"name": name, "device": device or "desktop"}
+        try:
+            details = await asyncio.wait_for(check(page, url), SCENARIO_TIMEOUT_S)
+            if page_errors:
+                raise AssertionError(f"{len(page_errors)} page error(s): {page_errors[0]}")
+            result.update(status="pass", **(details or {}))
+        except Exception as e:
+            result.update(status="fail", error=describe_error(e))
+            try:
+                await page.screenshot(path=os.path.join(SCREENSHOT_DIR, f"{name}_error.png"))
+            except Exception:
+                pass
+        finally:
+            result["duration_ms"] = round((time.perf_counter() - started) * 1000)
+            await context.close()
+        return result
+
+async def run(url, names, concurrency):
+    os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency or len(names))
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            return await asyncio.gather(*(run_scenario(p, browser, n, url, semaphore) for n in names))
+        finally:
+            await browser.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run all browser verification scenarios concurrently in one Chromium.")
+    parser.add_argument("--mode", choices=["dev", "preview"], default="dev", help="Serve with `npm run dev` or `npm run preview`")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Run only these scenarios (repeatable)")
+    parser.add_argument("--concurrency", type=int, default=0, help="Max scenarios in flight (default: all)")
+    parser.add_argument("--json", nargs="?", const="", help="Also write results JSON (default path under perf_results/)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with DevServer(args.mode) as server:
+        results = asyncio.run(run(server.url, args.scenario or list(SCENARIOS), args.concurrency))
+    total_ms = round((time.perf_counter() - started) * 1000)
+
+    for r in results:
+        line = f"{r['status'].upper():4}  {r['name']:16} {r['device']:10} {r['duration_ms']:6d} ms"
+        print(line + (f"  {r['error']}" if "error" in r else ""))
+    failed = [r for r in results if r["status"] != "pass"]
+    print(f"\n{len(results) - len(failed)}/{len(results)} passed in {total_ms} ms")
+
+    if args.json is not None:
+        write_json(args.json or timestamped("verifications"), {"total_ms": total_ms, "scenarios": results})
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,164 @@
+import sys
+import time
+import asyncio
+import argparse
+from playwright.async_api import async_playwright
+
+from perf_harness import (
+    DevServer, READY_TIMEOUT_MS, VIEWPORT, launch_browser, new_instrumented_page,
+    wait_for_game_ready, start_game, write_json, timestamped,
+)
+
+# Loops modal open/close, Lobby <-> Level_01 switches and projectile bursts through the
+# DebugHooks actions, samples memory after each cycle and fits a linear trend per metric.
+
+# Configuration
+DEFAULT_MINUTES = 10
+WARMUP_FRACTION = 0.2  # first caches/shader compiles legitimately grow; fit the rest
+MIN_SAMPLES = 5
+# A metric leaks when it grows faster than this per minute *and* the growth is steady (R^2)
+LEAK_SLOPE_PER_MIN = {
+    "heap_mb": 0.5,
+    "dom_nodes": 50,
+    "listeners": 20,
+    "geometries": 2,
+    "textures": 2,
+    "programs": 1,
+}
+MIN_R2 = 0.6
+
+async def wait_frames(page, count=2):
+    await page.wait_for_function(
+        "(target) => window.__PFISO_DEBUG__ && window.__PFISO_DEBUG__.frame >= target",
+        arg=await page.evaluate(f"() => window.__PFISO_DEBUG__.frame + {count}"),
+    )
+
+async def cycle(page):
+    # Project modal
+    await page.evaluate("() => window.__PFISO_DEBUG__.setProjectModalOpen(true)")
+    await asyncio.sleep(0.5)
+    await page.evaluate("() => window.__PFISO_DEBUG__.setProjectModalOpen(false)")
+    await asyncio.sleep(0.3)
+
+    # Scene switch. The loader only shows while a chunk/asset is still loading, so wait for the
+    # scene's Suspense boundary to commit (DebugSceneMarker) rather than for the loader to clear.
+    for scene in ("Lobby", "Level_01"):
+        await page.evaluate("(name) => window.__PFISO_DEBUG__.setScene(name)", scene)
+        await page.wait_for_function("(name) => window.__PFISO_DEBUG__.scene() === name", arg=scene, timeout=READY_TIMEOUT_MS)
+        await wait_frames(page)
+
+    # Projectile bursts (pool of 100, 2 s lifetime)
+    for _ in range(5):
+        await page.evaluate("() => window.__PFISO_DEBUG__.fireProjectiles(10)")
+        await asyncio.sleep(0.2)
+
+async def sample(page, cdp, collect_garbage):
+    if collect_garbage:
+        # Measure what is retained, not where the GC sawtooth happens to be
+        await cdp.send("HeapProfiler.collectGarbage")
+    heap = await cdp.send("Runtime.getHeapUsage")
+    counters = await cdp.send("Memory.getDOMCounters")
+    renderer = await page.evaluate("() => window.__PFISO_DEBUG__.renderer()")
+    return {
+        "heap_mb": round(heap["usedSize"] / 2**20, 3),
+        "dom_nodes": counters["nodes"],
+        "listeners": counters["jsEventListeners"],
+        "geometries": renderer["geometries"],
+        "textures": renderer["textures"],
+        "programs": renderer["programs"],
+    }
+
+def linear_fit(xs, ys):
+    """Least-squares slope and R^2."""
+    n = len(xs)
+    mx, my = sum(xs) / n, sum(ys) / n
+    sxx = sum((x - mx) ** 2 for x in xs)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    syy = sum((y - my) ** 2 for y in ys)
+    if sxx == 0:
+        return 0.0, 0.0
+    slope = sxy / sxx
+    r2 = (sxy * sxy) / (sxx * syy) if syy else 0.0
+    return slope, r2
+
+def analyze(samples):
+    fitted = samples[int(len(samples) * WARMUP_FRACTION):]
+    if len(fitted) < MIN_SAMPLES:
+        return {}
+    minutes = [s["t"] / 60 for s in fitted]
+    trends = {}
+    for metric, limit in LEAK_SLOPE_PER_MIN.items():
+        values = [s[metric] for s in fitted]
+        slope, r2 = linear_fit(minutes, values)
+        trends[metric] = {
+            "start": values[0],
+            "end": values[-1],
+            "slope_per_min": round(slope, 3),
+            "r2": round(r2, 3),
+            "leak": slope > limit and r2 >= MIN_R2,
+        }
+    return trends
+
+async def soak(url, minutes, collect_garbage):
+    samples = []
+    async with async_playwright() as p:
+        browser = await launch_browser(p)
+        try:
+            context = await browser.new_context(viewport=VIEWPORT)
+            page = await new_instrumented_page(context, debug_hooks=True)
+            errors = []
+            page.on("pageerror", lambda exc: errors.append(str(exc)))
+            await page.goto(url)
+            await wait_for_game_ready(page)
+            await start_game(page)
+            await page.wait_for_function("() => window.__PFISO_DEBUG__ && window.__PFISO_DEBUG__.frame > 0")
+            cdp = await context.new_cdp_session(page)
+
+            started = time.perf_counter()
+            deadline = started + minutes * 60
+            cycles = 0
+            while time.perf_counter() < deadline:
+                await cycle(page)
+                cycles += 1
+                s = await sample(page, cdp, collect_garbage)
+                s["t"] = round(time.perf_counter() - started, 1)
+                s["cycle"] = cycles
+                samples.append(s)
+                print(f"[{s['t']:7.1f}s] cycle {cycles:4d}  heap {s['heap_mb']:7.2f} MiB  dom {s['dom_nodes']:5d}  "
+                      f"listeners {s['listeners']:5d}  geo {s['geometries']:4d}  tex {s['textures']:4d}  prog {s['programs']:3d}")
+            await context.close()
+        finally:
+            await browser.close()
+    return samples, errors
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak test: loop modals, scene switches and projectiles, fail on steady memory growth.")
+    parser.add_argument("--mode", choices=["dev", "preview"], default="preview", help="Serve with `npm run dev` or `npm run preview`")
+    parser.add_argument("--minutes", type=float, default=DEFAULT_MINUTES, help="How long to loop")
+    parser.add_argument("--no-gc", action="store_true", help="Don't force a GC before each sample")
+    parser.add_argument("--out", help="Results JSON (default: perf_results/soak-<timestamp>.json)")
+    args = parser.parse_args()
+
+    with DevServer(args.mode) as server:
+        samples, errors = asyncio.run(soak(server.url, args.minutes, not args.no_gc))
+
+    trends = analyze(samples)
+    leaks = [m for m, t in trends.items() if t["leak"]]
+    write_json(args.out or timestamped("soak"), {
+        "minutes": args.minutes, "cycles": len(samples), "trends": trends, "leaks": leaks,
+        "page_errors": errors, "samples": samples,
+    })
+
+    if not trends:
+        print(f"Only {len(samples)} samples, need at least {MIN_SAMPLES} after warm-up; run longer")
+        sys.exit(1)
+    print(f"\n{'metric':12} {'start':>10} {'end':>10} {'per min':>10} {'r2':>6}")
+    for metric, t in trends.items():
+        flag = "  LEAK" if t["leak"] else ""
+        print(f"{metric:12} {t['start']:>10} {t['end']:>10} {t['slope_per_min']:>10} {t['r2']:>6}{flag}")
+    if errors:
+        print(f"\n{len(errors)} page error(s), first: {errors[0]}")
+    if leaks:
+        print(f"\nSteady growth in: {', '.join(leaks)}")
+        sys.exit(1)
+    print("\nNo steady growth detected")
@@ -2,6 +2,7 @@ import { Suspense, useState, useEffect, lazy } from 'react'
 import { Canvas } from '@react-three/fiber'
 import { Preload, BakeShadows, AdaptiveDpr, AdaptiveEvents, OrbitControls } from '@react-three/drei'
 const Level_01 = lazy(() => import('./scenes/Level_01'))
+const Lobby = lazy(() => import('./scenes/Lobby'))
 // import HUD from './components/ui/HUD' // Removed default import to fix conflict
 const InventoryUI = lazy(() => import('./components/ui/InventoryUI'))
 const PauseMenu = lazy(() => import('./components/ui/PauseMenu'))
@@ -33,12 +34,13 @@ import { SubtitleOverlay } from './components/ui/SubtitleOverlay'
 const AchievementToast = lazy(() => import('./components/ui/AchievementToast'))
 const BossHealthBar = lazy(() => import('./components/ui/BossHealthBar')) // SYS-043
 const PerformanceMonitor = lazy(() => import('./components/debug/PerformanceMonitor'))
+import { DebugHooks, DebugSceneMarker } from './components/debug/DebugHooks'
 import { useUIStore } from './stores/uiStore'
 import { TelemetryManager } from './systems/TelemetryManager'
 import useAudioStore from './audioStore'
 import useGameStore from './store'
 import Hotbar from './components/ui/Hotbar'
-import { resolveAssetPath } from './utils/assetUtils'
+import { resolveAssetPath, resolveSrcSet, placeholderStyle } from './utils/assetUtils'
 import ErrorBoundary from './components/ui/ErrorBoundary'
 
 
@@ -62,7 +64,10 @@ function App() {
     const motesCollected = useGameStore(state => state.motesCollected)
     const hasShownSurvey = useGameStore(state => state.hasShownSurvey)
     const isPhotoMode = useGameStore(state => state.isPhotoMode)
-    const { isProjectModalOpen, toggleProjectModal } = useUIStore()
+    const { isProjectModalOpen, toggleProjectModal, activeScene } = useUIStore()
+    // Test-only: the Lobby is reachable solely through the debug hooks (soak_test.py,
+    // run_verifications.py); players always get Level_01.
+    const scene = window.__PFISO_DEBUG_HOOKS__ ? activeScene : 'Level_01'
 
     // State for collapsing the project section
     const [isProjectSectionOpen, setIsProjectSectionOpen] = useState(false)
@@ -159,6 +164,7 @@ function App() {
                         dpr={settings.resolutionScale} // UX-029: Dynamic Resolution Scale
                     >
                         <FPSLimiter limit={30} />
+                        <DebugHooks />
 
                         {/* Camera System (Handles View) */}
                         {/* Camera System moved to Level_01 to access Physics */}
@@ -175,7 +181,8 @@ function App() {
                         />}
 
                         <Suspense fallback={<LoadingScreen />}>
-                            <Level_01 />
+                            {scene === 'Lobby' ? <Lobby /> : <Level_01 />}
+                            <DebugSceneMarker name={scene} />
                             <InteractionManager />
                             <TelemetryManager />
                             <CameraShake />
@@ -266,8 +273,15 @@ function App() {
                                         {project.heroImage && (
                                             <img
                                                 src={resolveAssetPath(project.heroImage)}
+                                                srcSet={resolveSrcSet(project.imageVariants?.[project.heroImage])}
+                                                sizes="100vw"
+                                                width={project.imageVariants?.[project.heroImage]?.width}
+                                                height={project.imageVariants?.[project.heroImage]?.height}
+                                                loading="lazy"
+                                                decoding="async"
                                                 alt={project.title}
                                                 className="mobile-project-image"
+                                                style={placeholderStyle(project.imageVariants?.[project.heroImage])}
                                                 onError={(e) => {
                                                     (e.target as HTMLImageElement).style.display = 'none';
                                                 }}
@@ -113,6 +113,48 @@ const ListenerUpdater = ({ listener }: { listener: AudioListener }) => {
     return null
 }
 
+interface AudioSpriteManifest {
+    src: string
+    sampleRate: number
+    decoderDelay?: number
+    sprites: Record<string, { start: number, duration: number, frames: number, encoderDelay?: number, padding?: number }>
+}
+
+// Written by scripts/pack_audio_sprite.py. Globbed rather than imported so the build (and
+// the game) works without a sprite; the map is then empty and nothing is requested.
+const spriteManifests = import.meta.glob<AudioSpriteManifest>('../../assets/data/audio_sprite.json', { eager: true, import: 'default' })
+const audioSprite: AudioSpriteManifest | undefined = Object.values(spriteManifests)[0]
+
+// PERF: Decode a packed audio sprite once and slice it into per-clip buffers
+const loadAudioSprite = async (ctx: BaseAudioContext, manifest?: AudioSpriteManifest): Promise<Record<string, AudioBuffer>> => {
+    const clips: Record<string, AudioBuffer> = {}
+    if (!manifest) return clips
+    try {
+        const spriteRes = await fetch(manifest.src)
+        if (!spriteRes.ok) return clips
+        const sprite = await ctx.decodeAudioData(await spriteRes.arrayBuffer())
+
+        for (const [id, { start, duration, encoderDelay = 0, padding = 0 }] of Object.entries(manifest.sprites)) {
+            // Offsets are in seconds; the context may resample, so convert with the decoded rate.
+            // Decoder and encoder delay / padding are in samples at the sprite's own rate.
+            const lead = ((manifest.decoderDelay ?? 0) + encoderDelay) / manifest.sampleRate
+            const from = Math.round((start + lead) * sprite.sampleRate)
+            const audible = duration - (encoderDelay + padding) / manifest.sampleRate
+            const length = Math.min(Math.round(audible * sprite.sampleRate), sprite.length - from)
+            if (length <= 0) continue
+
+            const clip = ctx.createBuffer(sprite.numberOfChannels, length, sprite.sampleRate)
+            for (let ch = 0; ch < sprite.numberOfChannels; ch++) {
+                clip.copyToChannel(sprite.getChannelData(ch).subarray(from, from + length), ch)
+            }
+            clips[id] = clip
+        }
+    } catch (e) {
+        // Sprite missing or undecodable, fall back to individual files
+    }
+    return clips
+}
+
 export const SoundBankProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
     const { camera } = useThree()
     const [listener] = useState(() => new AudioListener())
@@ -226,7 +268,11 @@ export const SoundBankProvider: React.FC<{ children: React.ReactNode }> = ({ chi
 
             // Load audio files
             const memoryIds = ['mem-work-1', 'mem-proj-1', 'mem-skill-1', 'mem-contact-1']
-            await Promise.all(memoryIds.map(async (id) => {
+
+            // Prefer the packed sprite (scripts/pack_audio_sprite.py): one fetch + one decode for every clip
+            Object.assign(newBuffers, await loadAudioSprite(listener.context, audioSprite))
+
+            await Promise.all(memoryIds.filter(id => !newBuffers[id]).map(async (id) => {
                 let buffer: AudioBuffer | null = null;
                 try {
                     // Fix: Using relative path if import.meta not working, but sticking to existing pattern
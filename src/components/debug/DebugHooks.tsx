@@ -0,0 +1,137 @@
+import { useEffect, useRef } from 'react'
+import { useThree } from '@react-three/fiber'
+import * as THREE from 'three'
+import inputs from '../../systems/InputManager'
+import gameSystemInstance from '../../systems/GameSystem'
+import { projectilePool } from '../../stores/projectilePool'
+import { useUIStore, SceneName } from '../../stores/uiStore'
+
+// Window hooks for the Playwright tools in scripts/ (bench_input_latency.py, soak_test.py).
+// Only installed when the page sets window.__PFISO_DEBUG_HOOKS__ before load, which those tools
+// opt into via perf_harness.new_instrumented_page(debug_hooks=True), so normal sessions and the
+// frame-time/profiling benchmarks pay nothing.
+
+const FRAME_LOG_SIZE = 600 // ~10 seconds at 60fps
+
+export interface DebugFrame {
+    frame: number
+    t: number // performance.now() right after gl.render
+    moveX: number
+    moveY: number
+    lookX: number
+    lookY: number
+    jump: boolean
+    primary: boolean
+    player: [number, number, number]
+    camera: [number, number] // yaw, pitch
+}
+
+declare global {
+    interface Window {
+        __PFISO_DEBUG_HOOKS__?: boolean
+        __PFISO_DEBUG__?: {
+            frame: number
+            frames: (since?: number) => DebugFrame[]
+            player: () => { x: number, y: number, z: number }
+            renderer: () => { geometries: number, textures: number, programs: number, calls: number, triangles: number }
+            domNodes: () => number
+            scene: () => SceneName | null // scene whose Suspense boundary has committed
+            // Actions the soak test loops over
+            setScene: (scene: SceneName) => void
+            setProjectModalOpen: (open: boolean) => void
+            fireProjectiles: (count: number) => void
+        }
+    }
+}
+
+const euler = new THREE.Euler()
+const fireDir = new THREE.Vector3()
+let mountedScene: SceneName | null = null
+
+// Rendered inside the scene's Suspense boundary, so its effect runs only once the scene has
+// committed. Tools wait on __PFISO_DEBUG__.scene() after setScene() instead of the loader text,
+// which never shows when the scene's chunk and assets are already cached.
+export const DebugSceneMarker = ({ name }: { name: SceneName }) => {
+    useEffect(() => {
+        mountedScene = name
+        return () => {
+            if (mountedScene === name) mountedScene = null
+        }
+    }, [name])
+    return null
+}
+
+export const DebugHooks = () => {
+    const { gl, scene, camera } = useThree()
+    // Ring buffer, so recording costs no allocation beyond the entry itself
+    const log = useRef<DebugFrame[]>([])
+    const head = useRef(0)
+
+    useEffect(() => {
+        if (!window.__PFISO_DEBUG_HOOKS__) return
+
+        const hooks = window.__PFISO_DEBUG__ = {
+            frame: 0,
+            frames: (since = 0) => {
+                const ordered = [...log.current.slice(head.current), ...log.current.slice(0, head.current)]
+                return ordered.filter(f => f.t >= since)
+            },
+            player: () => ({ ...gameSystemInstance.playerPosition }),
+            renderer: () => ({
+                geometries: gl.info.memory.geometries,
+                textures: gl.info.memory.textures,
+                programs: gl.info.programs?.length ?? 0,
+                calls: gl.info.render.calls,
+                triangles: gl.info.render.triangles
+            }),
+            domNodes: () => document.getElementsByTagName('*').length,
+            scene: () => mountedScene,
+            setScene: (name: SceneName) => useUIStore.getState().setActiveScene(name),
+            setProjectModalOpen: (open: boolean) => {
+                const ui = useUIStore.getState()
+                if (ui.isProjectModalOpen !== open) ui.toggleProjectModal()
+            },
+            fireProjectiles: (count: number) => {
+                camera.getWorldDirection(fireDir)
+                for (let i = 0; i < count; i++) projectilePool.spawn(camera.position, fireDir, 20)
+            }
+        }
+
+        // Record after the frame is drawn (FPSLimiter decides when that happens), so each entry
+        // is the state a rendered frame actually showed.
+        const previous = scene.onAfterRender
+        scene.onAfterRender = (...args) => {
+            previous.apply(scene, args)
+            hooks.frame++
+            const p = gameSystemInstance.playerPosition
+            euler.setFromQuaternion(camera.quaternion, 'YXZ')
+            const entry: DebugFrame = {
+                frame: hooks.frame,
+                t: performance.now(),
+                moveX: inputs.getAxis('MOVE_X'),
+                moveY: inputs.getAxis('MOVE_Y'),
+                lookX: inputs.getAxis('LOOK_X'),
+                lookY: inputs.getAxis('LOOK_Y'),
+                jump: inputs.isPressed('JUMP'),
+                primary: inputs.isPressed('PRIMARY_ACTION'),
+                player: [p.x, p.y, p.z],
+                camera: [euler.y, euler.x]
+            }
+            if (log.current.length < FRAME_LOG_SIZE) {
+                log.current.push(entry)
+            } else {
+                log.current[head.current] = entry
+                head.current = (head.current + 1) % FRAME_LOG_SIZE
+            }
+        }
+
+        return () => {
+            scene.onAfterRender = previous
+            delete window.__PFISO_DEBUG__
+        }
+    }, [gl, scene, camera])
+
+    return null
+}
+
+export default DebugHooks
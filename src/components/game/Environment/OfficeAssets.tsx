@@ -1,7 +1,17 @@
 import React, { useRef } from 'react'
 import { Box, Cylinder, Sphere, Text, useTexture } from '@react-three/drei'
 import { RigidBody, CuboidCollider, CylinderCollider } from '@react-three/rapier'
-import { resolveAssetPath } from '../../../utils/assetUtils'
+import { resolveAssetPath, getTextureTier } from '../../../utils/assetUtils'
+import { useSettingsStore } from '../../../stores/settingsStore'
+import { isMobileUserAgent } from '../../../hooks/useDeviceDetect'
+import textureTiers from '../../../assets/data/textures.json'
+
+// PERF: Load the normal map tier that matches the quality preset (smaller on mobile)
+const useTieredTexturePath = (material: keyof typeof textureTiers) => {
+    const preset = useSettingsStore(state => state.qualityPreset)
+    const tier = getTextureTier(preset, isMobileUserAgent())
+    return resolveAssetPath(textureTiers[material].normal[tier])
+}
 
 export const OfficeDesk = (props: any) => {
     return (
@@ -23,7 +33,7 @@ export const OfficeDesk = (props: any) => {
 }
 
 const KeyboardMesh = () => {
-    const normalMap = useTexture(resolveAssetPath('assets/keyboard_normal.png'))
+    const normalMap = useTexture(useTieredTexturePath('keyboard'))
     return (
         <Box args={[0.45, 0.01, 0.15]} position={[0, 0.825, 0.2]}>
             <meshStandardMaterial color="#424242" roughness={0.8} normalMap={normalMap} />
@@ -33,7 +43,7 @@ const KeyboardMesh = () => {
 
 export const OfficeChair = (props: any) => {
     // VIS-032: Fabric Shader
-    const normalMap = useTexture(resolveAssetPath('assets/fabric_normal.png'))
+    const normalMap = useTexture(useTieredTexturePath('fabric'))
     normalMap.wrapS = normalMap.wrapT = 1000
     normalMap.repeat.set(2, 2)
 
@@ -3,6 +3,7 @@ import * as THREE from 'three'
 import { useThree } from '@react-three/fiber'
 import { Line } from '@react-three/drei'
 import navigationSystem from '../../systems/NavigationSystem'
+import { resolveAssetPath } from '../../utils/assetUtils'
 
 interface NavigationManagerProps {
     debug?: boolean
@@ -14,12 +15,22 @@ export const NavigationManager: React.FC<NavigationManagerProps> = ({ debug = fa
     const { scene } = useThree()
 
     // Initialize NavMesh
+    // PERF-024: Prefer the offline bake; only fall back to baking the floor mesh at runtime
     useEffect(() => {
-        if (meshRef.current) {
+        let cancelled = false
+        const runtimeBake = () => {
+            if (cancelled || !meshRef.current) return
             // Ensure the matrix is updated world-space
             meshRef.current.updateMatrixWorld()
             navigationSystem.init(meshRef.current)
         }
+
+        fetch(resolveAssetPath(`./assets/nav/${navigationSystem.ZONE}.json`))
+            .then(res => res.ok ? res.json() : Promise.reject(res.status))
+            .then(zone => { if (!cancelled) navigationSystem.loadBakedZone(zone) })
+            .catch(runtimeBake)
+
+        return () => { cancelled = true }
     }, [])
 
     // Debug: Test pathfinding on click (TEMPORARY: Remove or disable for prod)
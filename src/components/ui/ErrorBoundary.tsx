@@ -23,6 +23,10 @@ class ErrorBoundary extends Component<Props, State> {
 
   public componentDidCatch(error: Error, errorInfo: ErrorInfo) {
     console.error("Uncaught error:", error, errorInfo);
+    // The pre-rendered snapshot (scripts/prerender_content.py) sits above everything and is
+    // normally removed when LoadingScreen unmounts. If the Canvas throws first, that never
+    // happens and the snapshot would hide this error screen for good.
+    document.getElementById('prerender-snapshot')?.remove();
   }
 
   public render() {
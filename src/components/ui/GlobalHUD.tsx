@@ -88,6 +88,7 @@ const GlobalHUD: React.FC<GlobalHUDProps> = ({ onNavigate, activeSection }) => {
         {navItems.map((item) => (
           <motion.button
             key={item.id}
+            aria-label={item.label} // the text label is hidden on phones
             onClick={() => {
               playSound('click');
               onNavigate(item.id);
@@ -137,6 +138,7 @@ const GlobalHUD: React.FC<GlobalHUDProps> = ({ onNavigate, activeSection }) => {
         <motion.a
           href="./assets/resume.pdf"
           download
+          aria-label="CV"
           whileHover={{ scale: 1.05 }}
           whileTap={{ scale: 0.95 }}
           style={{
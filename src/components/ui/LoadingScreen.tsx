@@ -15,6 +15,10 @@ export const LoadingScreen: React.FC = ({ progress = 0, showError = false }: any
   const [loadingText, setLoadingText] = useState("Loading...");
   const [currentTipIndex, setCurrentTipIndex] = useState(0);
 
+  // The pre-rendered snapshot (scripts/prerender_content.py) covers the page until the first
+  // scene is ready, i.e. until this fallback unmounts
+  useEffect(() => () => document.getElementById('prerender-snapshot')?.remove(), []);
+
   // Cycle tips every 4 seconds
   useEffect(() => {
     const interval = setInterval(() => {
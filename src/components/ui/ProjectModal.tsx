@@ -5,7 +5,7 @@ import Modal from './Modal';
 import { useDeviceDetect } from '../../hooks/useDeviceDetect';
 import useGameStore from '../../store';
 import { useEffect } from 'react';
-import { resolveAssetPath } from '../../utils/assetUtils';
+import { resolveAssetPath, resolveSrcSet, placeholderStyle, ImageVariants } from '../../utils/assetUtils';
 
 interface CaseStudy {
   id: string;
@@ -37,6 +37,7 @@ interface CaseStudy {
     reflection: string;
   };
   featured?: boolean;
+  imageVariants?: Record<string, ImageVariants>;
 }
 
 interface ProjectModalProps {
@@ -114,7 +115,18 @@ const ProjectModal: React.FC<ProjectModalProps> = ({ isOpen, onClose, projects }
                   </div>
                 )}
                 <div style={{ width: '100%', height: '150px', background: '#eee', display: 'flex', alignItems: 'center', justifyContent: 'center', borderBottom: '2px solid var(--color-ui-border)', overflow: 'hidden' }}>
-                  <img src={resolveAssetPath(project.heroImage)} alt={project.title} style={{ width: '100%', height: '100%', objectFit: 'cover' }} onError={(e) => (e.currentTarget.src = resolveAssetPath('./assets/placeholder_sm.webp'))} />
+                  <img
+                    src={resolveAssetPath(project.heroImage)}
+                    srcSet={resolveSrcSet(project.imageVariants?.[project.heroImage])}
+                    sizes={isMobile ? '100vw' : '300px'}
+                    width={project.imageVariants?.[project.heroImage]?.width}
+                    height={project.imageVariants?.[project.heroImage]?.height}
+                    loading="lazy"
+                    decoding="async"
+                    alt={project.title}
+                    style={{ width: '100%', height: '100%', objectFit: 'cover', ...placeholderStyle(project.imageVariants?.[project.heroImage]) }}
+                    onError={(e) => (e.currentTarget.src = resolveAssetPath('./assets/placeholder_sm.webp'))}
+                  />
                 </div>
                 <div style={{ padding: '15px', flex: 1, display: 'flex', flexDirection: 'column' }}>
                   <h3 style={{ fontFamily: '"Press Start 2P", cursive', fontSize: '12px', marginTop: 0, marginBottom: '10px', lineHeight: '1.4' }}>{project.title}</h3>
@@ -154,8 +166,13 @@ const ProjectModal: React.FC<ProjectModalProps> = ({ isOpen, onClose, projects }
               <div style={{ marginBottom: '40px', borderBottom: '2px solid #eee', paddingBottom: '20px' }}>
                 <img
                   src={resolveAssetPath(selectedProject.heroImage)}
+                  srcSet={resolveSrcSet(selectedProject.imageVariants?.[selectedProject.heroImage])}
+                  sizes="(max-width: 900px) 100vw, 900px"
+                  width={selectedProject.imageVariants?.[selectedProject.heroImage]?.width}
+                  height={selectedProject.imageVariants?.[selectedProject.heroImage]?.height}
+                  decoding="async"
                   alt="Hero"
-                  style={{ width: '100%', maxHeight: '400px', objectFit: 'cover', borderRadius: '8px', border: '2px solid #000' }}
+                  style={{ width: '100%', height: 'auto', maxHeight: '400px', objectFit: 'cover', borderRadius: '8px', border: '2px solid #000', ...placeholderStyle(selectedProject.imageVariants?.[selectedProject.heroImage]) }}
                   onError={(e) => (e.currentTarget.src = resolveAssetPath('./assets/placeholder_hero.webp'))}
                 />
                 <div style={{ marginTop: '20px' }}>
@@ -11,6 +11,8 @@ export interface ModalContent {
     type?: 'PROJECT' | 'EXPERIENCE' | 'GENERIC' | 'CONTACT'
 }
 
+export type SceneName = 'Level_01' | 'Lobby'
+
 interface UIState {
     isModalOpen: boolean
     modalContent: ModalContent | null
@@ -29,6 +31,11 @@ interface UIState {
     isProjectModalOpen: boolean
     toggleProjectModal: () => void
 
+    // Scene mounted in the Canvas. Test-only: App ignores anything but Level_01 unless the debug
+    // hooks are enabled (window.__PFISO_DEBUG_HOOKS__), so players can never land in the Lobby.
+    activeScene: SceneName
+    setActiveScene: (scene: SceneName) => void
+
     // SYS-035: Subtitles
     subtitle: string | null
     subtitleDuration: number
@@ -71,6 +78,9 @@ export const useUIStore = create<UIState>((set) => ({
     isProjectModalOpen: false,
     toggleProjectModal: () => set((state) => ({ isProjectModalOpen: !state.isProjectModalOpen })),
 
+    activeScene: 'Level_01',
+    setActiveScene: (scene) => set({ activeScene: scene }),
+
     // UX-010
     hudOpacity: 1.0,
     setHudOpacity: (val) => set({ hudOpacity: val }),
@@ -34,14 +34,34 @@ class NavigationSystem {
     }
 
     // PERF-024: Support for pre-baked NavMesh
-    // Call this with JSON data from offline baking
+    // Call this with JSON data from offline baking (scripts/bake_navmesh.py)
     loadBakedZone(zoneData: any) {
         if (this.isReady) return;
-        this.pathfinding.setZoneData(this.ZONE, zoneData);
+        const zone = zoneData?.format === 'pfiso-navmesh' ? NavigationSystem.hydrateBakedZone(zoneData) : zoneData;
+        this.pathfinding.setZoneData(this.ZONE, zone);
         this.isReady = true;
         console.log("Navigation mesh initialized (Pre-baked).");
     }
 
+    /**
+     * Expands the compact baked format (flat vertex array, array centroids) into the
+     * zone structure Pathfinding.createZone would have produced at runtime.
+     */
+    static hydrateBakedZone(baked: { vertices: number[], groups: { neighbours: number[], vertexIds: number[], centroid: number[], portals: number[][] }[][] }) {
+        const vertices: THREE.Vector3[] = []
+        for (let i = 0; i < baked.vertices.length; i += 3) {
+            vertices.push(new THREE.Vector3(baked.vertices[i], baked.vertices[i + 1], baked.vertices[i + 2]))
+        }
+        const groups = baked.groups.map(group => group.map((node, id) => ({
+            id,
+            neighbours: node.neighbours,
+            vertexIds: node.vertexIds,
+            centroid: new THREE.Vector3().fromArray(node.centroid),
+            portals: node.portals
+        })))
+        return { vertices, groups }
+    }
+
     /**
      * Finds a path between two points
      */
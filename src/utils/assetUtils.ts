@@ -1,3 +1,5 @@
+import type { CSSProperties } from 'react';
+
 
 /**
  * Resolves an asset path relative to the application base URL.
@@ -20,3 +22,52 @@ export const resolveAssetPath = (path: string): string => {
 
     return path;
 }
+
+export interface ImageVariants {
+    width: number;
+    height: number;
+    srcset: { src: string; width: number }[];
+    placeholder?: string;
+    color?: string;
+}
+
+/**
+ * Builds an <img> srcset string from variants generated by scripts/build_responsive_images.py.
+ *
+ * @param variants Responsive variant metadata for a single image (may be undefined)
+ * @returns A srcset attribute value, or undefined when no variants exist
+ */
+export const resolveSrcSet = (variants?: ImageVariants): string | undefined => {
+    if (!variants || variants.srcset.length === 0) return undefined;
+    return variants.srcset.map(v => `${resolveAssetPath(v.src)} ${v.width}w`).join(', ');
+}
+
+/**
+ * Paints the precomputed LQIP behind an <img> until the real bytes arrive.
+ *
+ * @param variants Responsive variant metadata for a single image (may be undefined)
+ * @returns Inline style props, empty when the image has no placeholder
+ */
+export const placeholderStyle = (variants?: ImageVariants): CSSProperties => {
+    if (!variants?.placeholder) return {};
+    return {
+        backgroundColor: variants.color,
+        backgroundImage: `url(${variants.placeholder})`,
+        backgroundSize: 'cover',
+    };
+}
+
+export type TextureTier = 'low' | 'medium' | 'high'
+
+/**
+ * Picks which texture tier (built by scripts/pack_textures.py) to load.
+ * Mobile drops one tier below the preset to save memory and bandwidth.
+ *
+ * @param preset The user's graphics quality preset
+ * @param isMobile Whether the device is a phone/tablet
+ */
+export const getTextureTier = (preset: 'LOW' | 'MEDIUM' | 'HIGH', isMobile: boolean): TextureTier => {
+    if (preset === 'LOW') return 'low';
+    if (preset === 'MEDIUM') return isMobile ? 'low' : 'medium';
+    return isMobile ? 'medium' : 'high';
+}
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tools in scripts/ are run as plain scripts, not an installed package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
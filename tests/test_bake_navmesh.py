@@ -0,0 +1,38 @@
+from bake_navmesh import bake_zone, triangulate_layout
+
+# Two 1x1 cells side by side, split like THREE.PlaneGeometry:
+#   3---4---5      polygon 0 = (0, 3, 1), 1 = (3, 4, 1)
+#   | \ | \ |      polygon 2 = (1, 4, 2), 3 = (4, 5, 2)
+#   0---1---2
+LAYOUT = {"bounds": [0, 0, 2, 1], "cellSize": 1, "y": 0}
+
+def bake(**overrides):
+    return bake_zone(*triangulate_layout(dict(LAYOUT, **overrides)))
+
+def test_grid_neighbours_share_an_edge():
+    zone = bake()
+    assert len(zone["vertices"]) == 6 * 3
+    [nodes] = zone["groups"]
+    assert [n["vertexIds"] for n in nodes] == [[0, 3, 1], [3, 4, 1], [1, 4, 2], [4, 5, 2]]
+    assert [n["neighbours"] for n in nodes] == [[1], [0, 2], [1, 3], [2]]
+    assert nodes[0]["centroid"] == [0.33, 0, 0.33]
+
+def test_grid_portals_are_the_shared_edge_in_polygon_order():
+    [nodes] = bake()["groups"]
+    assert [n["portals"] for n in nodes] == [[[3, 1]], [[1, 3], [4, 1]], [[1, 4], [4, 2]], [[2, 4]]]
+
+def test_disconnected_cells_form_separate_groups():
+    # Three cells with the middle one blocked: the outer two share only vertices, not an edge
+    zone = bake(bounds=[0, 0, 3, 1], obstacles=[[1, 0, 2, 1]])
+    assert [len(g) for g in zone["groups"]] == [2, 2]
+    for nodes in zone["groups"]:
+        assert [n["neighbours"] for n in nodes] == [[1], [0]]
+
+def test_duplicate_vertices_are_welded():
+    # The same two cells as a triangle soup, one vertex entry per corner per triangle
+    vertices, triangles = triangulate_layout(LAYOUT)
+    soup = [vertices[v] for tri in triangles for v in tri]
+    zone = bake_zone(soup, [(i, i + 1, i + 2) for i in range(0, len(soup), 3)])
+    assert len(zone["vertices"]) == 6 * 3
+    [nodes] = zone["groups"]
+    assert [n["neighbours"] for n in nodes] == [[1], [0, 2], [1, 3], [2]]
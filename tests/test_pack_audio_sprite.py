@@ -0,0 +1,166 @@
+import json
+
+import pytest
+
+from pack_audio_sprite import Mp3Error, pack_audio_sprite, parse_frame_header, read_frames
+
+# 128 kbps / 44.1 kHz MPEG-1 Layer III, no CRC: 144 * 128000 / 44100 = 417 bytes, 1152 samples
+MPEG1_L3 = bytes([0xFF, 0xFB, 0x90, 0x00])
+MPEG1_L3_LENGTH = 417
+# 64 kbps / 22.05 kHz MPEG-2 Layer III, no CRC: 72 * 64000 / 22050 = 208 bytes, 576 samples
+MPEG2_L3 = bytes([0xFF, 0xF3, 0x80, 0x00])
+MPEG2_L3_LENGTH = 208
+# Same as MPEG1_L3 but 48 kHz: 144 * 128000 / 48000 = 384 bytes
+MPEG1_L3_48K = bytes([0xFF, 0xFB, 0x94, 0x00])
+MPEG1_L3_48K_LENGTH = 384
+
+def frame(header, length, marker=0):
+    # The marker byte lets tests tell frames apart after they have been copied around
+    return header + bytes([marker]) + bytes(length - 5)
+
+def frames(header, length, count, first_marker=0):
+    return [frame(header, length, first_marker + i) for i in range(count)]
+
+def id3v2(payload_size):
+    # Syncsafe size (7 bits per byte); the payload contains a fake sync word that must be skipped
+    size = bytes([(payload_size >> s) & 0x7F for s in (21, 14, 7, 0)])
+    payload = (MPEG1_L3 + bytes(payload_size))[:payload_size]
+    return b"ID3\x04\x00\x00" + size + payload
+
+def xing_frame():
+    # Stereo MPEG-1: 32 bytes of side info after the header, then the "Xing" tag
+    data = bytearray(frame(MPEG1_L3, MPEG1_L3_LENGTH))
+    data[36:40] = b"Xing"
+    return bytes(data)
+
+def lame_frame(delay, padding):
+    # Info tag with frame count, byte count, TOC and quality present, then the LAME extension
+    data = bytearray(frame(MPEG1_L3, MPEG1_L3_LENGTH))
+    data[36:44] = b"Info" + (0x0F).to_bytes(4, "big")
+    lame = 44 + 4 + 4 + 100 + 4
+    data[lame:lame + 9] = b"LAME3.100"
+    data[lame + 21:lame + 24] = bytes([delay >> 4, ((delay & 0x0F) << 4) | (padding >> 8), padding & 0xFF])
+    return bytes(data)
+
+def write(path, chunks):
+    path.write_bytes(b"".join(chunks))
+    return str(path)
+
+def test_parse_mpeg1_layer3_header():
+    header = parse_frame_header(MPEG1_L3, 0)
+    assert header["sample_rate"] == 44100
+    assert header["bitrate"] == 128000
+    assert header["samples"] == 1152
+    assert header["length"] == MPEG1_L3_LENGTH
+    assert header["channels"] == 2
+
+def test_parse_mpeg2_layer3_header():
+    header = parse_frame_header(MPEG2_L3, 0)
+    assert header["sample_rate"] == 22050
+    assert header["samples"] == 576
+    assert header["length"] == MPEG2_L3_LENGTH
+
+def test_parse_rejects_non_sync_and_reserved_values():
+    assert parse_frame_header(b"\x00\xfb\x90\x00", 0) is None
+    assert parse_frame_header(b"\xff\xfb\xf0\x00", 0) is None  # bitrate index 15
+    assert parse_frame_header(b"\xff\xfb\x9c\x00", 0) is None  # sample rate index 3
+    assert parse_frame_header(MPEG1_L3[:3], 0) is None
+
+def test_read_frames_splits_mpeg1_stream(tmp_path):
+    raw = frames(MPEG1_L3, MPEG1_L3_LENGTH, 7)
+    parsed = read_frames(write(tmp_path / "a.mp3", raw))
+    assert len(parsed) == 7
+    assert [data for _, data in parsed] == raw
+    assert sum(h["samples"] for h, _ in parsed) == 7 * 1152
+
+def test_read_frames_splits_mpeg2_stream(tmp_path):
+    raw = frames(MPEG2_L3, MPEG2_L3_LENGTH, 5)
+    parsed = read_frames(write(tmp_path / "a.mp3", raw))
+    assert len(parsed) == 5
+    assert all(h["samples"] == 576 for h, _ in parsed)
+    assert [data for _, data in parsed] == raw
+
+def test_read_frames_skips_id3v2_and_xing_frame(tmp_path):
+    raw = frames(MPEG1_L3, MPEG1_L3_LENGTH, 4)
+    path = write(tmp_path / "a.mp3", [id3v2(64), xing_frame()] + raw)
+    parsed = read_frames(path)
+    assert [data for _, data in parsed] == raw
+
+def test_read_frames_strips_id3v1_trailer(tmp_path):
+    raw = frames(MPEG1_L3, MPEG1_L3_LENGTH, 3)
+    trailer = b"TAG" + bytes(125)
+    assert [data for _, data in read_frames(write(tmp_path / "a.mp3", raw + [trailer]))] == raw
+
+def test_read_frames_rejects_format_change(tmp_path):
+    raw = frames(MPEG1_L3, MPEG1_L3_LENGTH, 3) + frames(MPEG1_L3_48K, MPEG1_L3_48K_LENGTH, 3)
+    with pytest.raises(Mp3Error, match="format changes"):
+        read_frames(write(tmp_path / "a.mp3", raw))
+
+def test_read_frames_rejects_file_without_frames(tmp_path):
+    with pytest.raises(Mp3Error, match="no MPEG audio frames"):
+        read_frames(write(tmp_path / "a.mp3", [b"\x00"]))
+
+@pytest.mark.parametrize("header, length, samples, rate", [
+    (MPEG1_L3, MPEG1_L3_LENGTH, 1152, 44100),
+    (MPEG2_L3, MPEG2_L3_LENGTH, 576, 22050),
+])
+def test_pack_offsets_land_on_frame_boundaries(tmp_path, header, length, samples, rate):
+    counts = {"one": 3, "two": 5, "three": 2}
+    clips = {}
+    marker = 0
+    for clip_id, count in counts.items():
+        clips[clip_id] = frames(header, length, count, marker)
+        marker += count
+        write(tmp_path / f"{clip_id}.mp3", [id3v2(16)] + clips[clip_id])
+
+    manifest_path = tmp_path / "sprite.json"
+    manifest = pack_audio_sprite(str(tmp_path), list(counts), "sprite", str(manifest_path))
+    assert json.loads(manifest_path.read_text()) == manifest
+    assert manifest["sampleRate"] == rate
+    assert manifest["samplesPerFrame"] == samples
+
+    sprite = (tmp_path / "sprite.mp3").read_bytes()
+    frame_cursor = 0
+    for clip_id, count in counts.items():
+        entry = manifest["sprites"][clip_id]
+        assert entry["frames"] == count
+        assert entry["start"] == pytest.approx(frame_cursor * samples / rate)
+        assert entry["duration"] == pytest.approx(count * samples / rate)
+        # The clip's frames are copied verbatim at its byte offset (ID3 tag dropped)
+        offset = frame_cursor * length
+        assert sprite[offset:offset + count * length] == b"".join(clips[clip_id])
+        frame_cursor += count
+    assert len(sprite) == frame_cursor * length
+
+def test_pack_records_decoder_and_encoder_delay(tmp_path):
+    write(tmp_path / "tagged.mp3", [lame_frame(576, 1100)] + frames(MPEG1_L3, MPEG1_L3_LENGTH, 3))
+    write(tmp_path / "bare.mp3", [xing_frame()] + frames(MPEG1_L3, MPEG1_L3_LENGTH, 2))
+    manifest = pack_audio_sprite(str(tmp_path), ["tagged", "bare"], "sprite", str(tmp_path / "sprite.json"))
+    assert manifest["decoderDelay"] == 529
+    tagged = manifest["sprites"]["tagged"]
+    assert (tagged["encoderDelay"], tagged["padding"]) == (576, 1100)
+    assert tagged["frames"] == 3  # the Info frame itself is still dropped
+    assert "encoderDelay" not in manifest["sprites"]["bare"]
+
+def test_pack_skips_missing_clips(tmp_path):
+    write(tmp_path / "one.mp3", frames(MPEG1_L3, MPEG1_L3_LENGTH, 2))
+    manifest = pack_audio_sprite(str(tmp_path), ["missing", "one"], "sprite", str(tmp_path / "sprite.json"))
+    assert list(manifest["sprites"]) == ["one"]
+    assert manifest["sprites"]["one"]["start"] == 0
+
+def test_pack_writes_nothing_without_valid_clips(tmp_path):
+    (tmp_path / "one.mp3").write_bytes(b"\x00")  # like the committed placeholders
+    assert pack_audio_sprite(str(tmp_path), ["one"], "sprite", str(tmp_path / "sprite.json")) is None
+    assert not (tmp_path / "sprite.json").exists()
+    assert not (tmp_path / "sprite.mp3").exists()
+
+@pytest.mark.parametrize("second", [
+    (MPEG2_L3, MPEG2_L3_LENGTH),          # MPEG-2 after MPEG-1
+    (MPEG1_L3_48K, MPEG1_L3_48K_LENGTH),  # sample rate change
+])
+def test_pack_rejects_mixed_formats(tmp_path, second):
+    write(tmp_path / "one.mp3", frames(MPEG1_L3, MPEG1_L3_LENGTH, 2))
+    write(tmp_path / "two.mp3", frames(*second, 2))
+    with pytest.raises(Mp3Error, match="re-export"):
+        pack_audio_sprite(str(tmp_path), ["one", "two"], "sprite", str(tmp_path / "sprite.json"))
+    assert not (tmp_path / "sprite.json").exists()
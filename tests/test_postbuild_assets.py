@@ -0,0 +1,65 @@
+import json
+
+from postbuild_assets import FINGERPRINT_PATTERNS, MANIFEST_NAME, postbuild_assets
+
+def build_dist(root, hero=b"hero-v1"):
+    dist = root / "dist"
+    (dist / "assets" / "projects" / "p1").mkdir(parents=True)
+    (dist / "index.html").write_text('<script type="module" src="/PFISO/assets/index-Ab12Cd34.js"></script>')
+    # index lazily imports Lobby, Lobby imports back into index (Rollup does this for shared code)
+    (dist / "assets" / "index-Ab12Cd34.js").write_text('const L=()=>import("./Lobby-Zz99Yy_8.js");')
+    (dist / "assets" / "Lobby-Zz99Yy_8.js").write_text(
+        'import{a}from"./index-Ab12Cd34.js";const h="./assets/projects/p1/hero.webp";')
+    (dist / "assets" / "vendor-Qq11Ww22.js").write_text("export const v=1;")
+    (dist / "assets" / "projects" / "p1" / "hero.webp").write_bytes(hero)
+    public = root / "public"
+    public.mkdir()
+    return dist, public
+
+def run(tmp_path, hero=b"hero-v1"):
+    dist, public = build_dist(tmp_path, hero)
+    manifest = postbuild_assets(str(dist), FINGERPRINT_PATTERNS, str(public))
+    files = sorted(p.name for p in (dist / "assets").iterdir() if p.suffix == ".js")
+    return dist, manifest, files
+
+def bundle(files, prefix):
+    return next(f for f in files if f.startswith(prefix + "-"))
+
+def test_bundles_referencing_assets_get_new_names(tmp_path):
+    dist, manifest, files = run(tmp_path)
+    hero = manifest["assets/projects/p1/hero.webp"]["file"]
+    index, lobby = bundle(files, "index"), bundle(files, "Lobby")
+
+    # Lobby references the image directly, index reaches it through its import of Lobby
+    assert lobby != "Lobby-Zz99Yy_8.js"
+    assert index != "index-Ab12Cd34.js"
+    assert "vendor-Qq11Ww22.js" in files
+
+    lobby_text = (dist / "assets" / lobby).read_text()
+    assert hero.split("/")[-1] in lobby_text and f'"./{index}"' in lobby_text
+    assert f'"./{lobby}"' in (dist / "assets" / index).read_text()
+    assert f"/PFISO/assets/{index}" in (dist / "index.html").read_text()
+
+def test_changing_only_an_asset_renames_the_bundles(tmp_path):
+    _, _, first = run(tmp_path / "a", b"hero-v1")
+    _, _, second = run(tmp_path / "b", b"hero-v2")
+    assert bundle(first, "Lobby") != bundle(second, "Lobby")
+    assert bundle(first, "index") != bundle(second, "index")
+    assert "vendor-Qq11Ww22.js" in first and "vendor-Qq11Ww22.js" in second
+
+def test_manifest_marks_every_hashed_file_immutable(tmp_path):
+    dist, manifest, files = run(tmp_path)
+    on_disk = json.loads((dist / MANIFEST_NAME).read_text())
+    assert on_disk == manifest
+    immutable = {e["file"] for e in manifest.values() if e.get("immutable")}
+    assert {f"assets/{f}" for f in files} <= immutable
+    assert manifest["assets/projects/p1/hero.webp"]["file"] in immutable
+    assert "index.html" not in immutable
+
+def test_public_files_are_not_mistaken_for_vite_bundles(tmp_path):
+    dist, public = build_dist(tmp_path)
+    (public / "assets").mkdir()
+    for root in (public, dist):
+        (root / "assets" / "site-manifest.svg").write_text("<svg/>")
+    manifest = postbuild_assets(str(dist), FINGERPRINT_PATTERNS, str(public))
+    assert not manifest["assets/site-manifest.svg"].get("immutable")